@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+# Qt binding compatibility layer (PySide6 preferred, PyQt5 as a fallback).
+# Plugins import widgets from here so the binding probe runs once per process.
+try:
+    from PySide6.QtWidgets import (
+        QApplication, QCheckBox, QComboBox, QFormLayout, QGroupBox, QHBoxLayout, QLabel,
+        QLineEdit, QPushButton, QSpinBox, QTextEdit, QVBoxLayout, QWidget,
+    )
+    from PySide6.QtCore import Qt, QTimer
+    QT_API = "PySide6"
+except ModuleNotFoundError:
+    # Fallback if the host app uses PyQt5
+    from PyQt5.QtWidgets import (
+        QApplication, QCheckBox, QComboBox, QFormLayout, QGroupBox, QHBoxLayout, QLabel,
+        QLineEdit, QPushButton, QSpinBox, QTextEdit, QVBoxLayout, QWidget,
+    )
+    from PyQt5.QtCore import Qt, QTimer
+    QT_API = "PyQt5"
+
+__all__ = [
+    "QT_API",
+    "QApplication", "QCheckBox", "QComboBox", "QFormLayout", "QGroupBox", "QHBoxLayout",
+    "QLabel", "QLineEdit", "QPushButton", "QSpinBox", "QTextEdit", "QVBoxLayout", "QWidget",
+    "Qt", "QTimer",
+]
@@ -146,6 +146,7 @@ def generate_location_stack(
     attach_faction: bool = True,
     attach_rumors: bool = True,
     rumor_count: int = 6,
+    seed: int = 0,
 ) -> LocationStack:
 
     theme = theme if theme in BUILTIN_THEMES else "OSR"
@@ -239,7 +240,7 @@ def generate_location_stack(
 
     return LocationStack(
         version=1,
-        seed=getattr(rng, "_seed", 0),
+        seed=seed,
         created_utc=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         region=RegionLayer(
             name=region_name,
@@ -3,13 +3,14 @@ from __future__ import annotations
 import random
 from typing import Optional
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QPushButton,
     QTextEdit, QComboBox, QCheckBox, QSpinBox, QFormLayout
 )
 
 from campaign_forge.plugins.hexmap.generator import BUILTIN_THEMES
-from campaign_forge.plugins.dungeonmap.generator import DungeonGenConfig
+from campaign_forge.plugins.dungeonmap.generator import DungeonGenConfig, dungeon_contents_text
 
 from .generator import generate_location_stack, LocationStack, stack_to_markdown
 from .exports import export_session_pack
@@ -17,6 +18,9 @@ from .exports import export_session_pack
 # Name styles supported by the built-in names plugin
 NAME_STYLES = ["Fantasy", "Elven", "Dwarven", "Guttural"]
 
+# BUILTIN_THEMES is static, so sort its keys once rather than per widget
+_SORTED_THEMES = tuple(sorted(BUILTIN_THEMES))
+
 
 class LocationStackWidget(QWidget):
     PLUGIN_ID = "location_stack"
@@ -28,7 +32,39 @@ class LocationStackWidget(QWidget):
         self._generate_count = 0
         self._build_ui()
 
+        # State keys bound to their widgets/getters once instead of on every autosave.
+        self._dungeon_spins = (
+            ("max_rooms", self.max_rooms),
+            ("corridor_density", self.corridor_density),
+            ("dead_end_prune", self.dead_end_prune),
+            ("secret_doors", self.secret_doors),
+            ("secret_corridors", self.secret_corridors),
+        )
+        self._state_spec = (
+            ("theme", self.theme.currentText),
+            ("name_style", self.name_style.currentText),
+            ("attach_dungeon", self.attach_dungeon.isChecked),
+            ("attach_faction", self.attach_faction.isChecked),
+            ("attach_rumors", self.attach_rumors.isChecked),
+            ("rumor_count", self.rumor_count.value),
+            ("split_scratchpad", self.split_scratchpad.isChecked),
+        )
+        self._dungeon_state_spec = tuple((k, w.value) for k, w in self._dungeon_spins) + (
+            ("cave_mode", self.cave_mode.isChecked),
+        )
+
     def _build_ui(self) -> None:
+        # Suppress repaints while ~20 child widgets and layouts are created.
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_controls()
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # Knob enablement only depends on the checkbox; settle it after the first paint.
+        QTimer.singleShot(0, self._update_dungeon_knobs)
+
+    def _build_controls(self) -> None:
         root = QVBoxLayout(self)
 
         controls = QGroupBox("Location Stack Generator (Region → Site → Sub-site → Room)")
@@ -36,14 +72,12 @@ class LocationStackWidget(QWidget):
         controls.setLayout(form)
 
         self.theme = QComboBox()
-        for k in sorted(BUILTIN_THEMES.keys()):
-            self.theme.addItem(k)
+        self.theme.addItems(_SORTED_THEMES)
         self.theme.setCurrentText("OSR" if "OSR" in BUILTIN_THEMES else self.theme.itemText(0))
         form.addRow("Region theme:", self.theme)
 
         self.name_style = QComboBox()
-        for s in NAME_STYLES:
-            self.name_style.addItem(s)
+        self.name_style.addItems(NAME_STYLES)
         self.name_style.setCurrentText("Fantasy")
         form.addRow("Name style:", self.name_style)
 
@@ -110,7 +144,6 @@ class LocationStackWidget(QWidget):
         self.export_btn.clicked.connect(self.on_export)
 
         self.attach_dungeon.toggled.connect(self._update_dungeon_knobs)
-        self._update_dungeon_knobs()
 
     def _update_dungeon_knobs(self) -> None:
         enabled = self.attach_dungeon.isChecked()
@@ -131,22 +164,20 @@ class LocationStackWidget(QWidget):
         self._generate_count += 1
         seed = self.ctx.derive_seed(self.PLUGIN_ID, "generate", self._generate_count)
         rng = random.Random(seed)
-        try:
-            rng._seed = seed  # type: ignore[attr-defined]
-        except Exception:
-            pass
 
+        # Read each control once; the dungeon knobs are only consulted when a dungeon is attached.
+        attach_dungeon = self.attach_dungeon.isChecked()
         stack = generate_location_stack(
             rng,
             theme=self.theme.currentText().strip() or "OSR",
             name_style=self.name_style.currentText().strip() or "Fantasy",
-            attach_dungeon=self.attach_dungeon.isChecked(),
-            dungeon_cfg=self._make_dungeon_cfg(),
+            attach_dungeon=attach_dungeon,
+            dungeon_cfg=self._make_dungeon_cfg() if attach_dungeon else None,
             attach_faction=self.attach_faction.isChecked(),
             attach_rumors=self.attach_rumors.isChecked(),
             rumor_count=int(self.rumor_count.value()),
+            seed=seed,
         )
-        stack.seed = seed  # type: ignore[misc]
         self._stack = stack
 
         self.out.setPlainText(stack_to_markdown(stack))
@@ -168,40 +199,38 @@ class LocationStackWidget(QWidget):
             self.ctx.log("[LocationStack] Sent single entry to scratchpad.")
             return
 
-        self._send_entry(
-            "Region",
-            f"**{stack.region.name}** — Theme **{stack.region.theme}**, terrain **{stack.region.terrain}**.\n\n"
-            f"Encounters: " + ", ".join(stack.region.content.get("encounters", [])) + "\n\n"
-            f"Hazards: " + ", ".join(stack.region.content.get("hazards", [])) + "\n\n"
-            f"Resources: " + ", ".join(stack.region.content.get("resources", [])),
-            tags=stack.region.tags,
-        )
-
-        self._send_entry(
-            "Site",
-            f"**{stack.site.name}** ({stack.site.site_type}) — POI vibe: **{stack.site.poi}**.\n\n"
-            + "\n".join(f"- {n}" for n in stack.site.notes),
-            tags=stack.site.tags,
-        )
+        region = stack.region
+        content = region.content
+        parts = [
+            f"**{region.name}** — Theme **{region.theme}**, terrain **{region.terrain}**.\n\n",
+            "Encounters: ", ", ".join(content.get("encounters", [])), "\n\n",
+            "Hazards: ", ", ".join(content.get("hazards", [])), "\n\n",
+            "Resources: ", ", ".join(content.get("resources", [])),
+        ]
+        self._send_entry("Region", "".join(parts), tags=region.tags)
+
+        site = stack.site
+        parts = [f"**{site.name}** ({site.site_type}) — POI vibe: **{site.poi}**.\n\n"]
+        parts.append("\n".join([f"- {n}" for n in site.notes]))
+        self._send_entry("Site", "".join(parts), tags=site.tags)
 
         if stack.faction:
-            self._send_entry(
-                "Faction",
-                f"**{stack.faction.name}** ({stack.faction.faction_type})\n\n"
-                + "**Methods:**\n" + "\n".join(f"- {m}" for m in stack.faction.methods)
-                + "\n\n**Hooks:**\n" + "\n".join(f"- {h}" for h in stack.faction.hooks),
-                tags=stack.faction.tags,
-            )
+            faction = stack.faction
+            parts = [
+                f"**{faction.name}** ({faction.faction_type})\n\n",
+                "**Methods:**\n", "\n".join([f"- {m}" for m in faction.methods]),
+                "\n\n**Hooks:**\n", "\n".join([f"- {h}" for h in faction.hooks]),
+            ]
+            self._send_entry("Faction", "".join(parts), tags=faction.tags)
 
         if stack.rumors:
             self._send_entry(
                 "Rumors",
-                "\n".join(f"{i+1}. {r}" for i, r in enumerate(stack.rumors.rumors)),
+                "\n".join([f"{i}. {r}" for i, r in enumerate(stack.rumors.rumors, 1)]),
                 tags=stack.rumors.tags,
             )
 
         if stack.subsite.dungeon:
-            from campaign_forge.plugins.dungeonmap.generator import dungeon_contents_text
             self._send_entry(
                 "Sub-site",
                 f"**{stack.subsite.name}** ({stack.subsite.subsite_type})\n\n"
@@ -227,25 +256,10 @@ class LocationStackWidget(QWidget):
         self.ctx.log(f"[LocationStack] Exported session pack: {pack_dir}")
 
     def serialize_state(self) -> dict:
-        return {
-            "version": 1,
-            "generate_count": int(self._generate_count),
-            "theme": self.theme.currentText(),
-            "name_style": self.name_style.currentText(),
-            "attach_dungeon": bool(self.attach_dungeon.isChecked()),
-            "attach_faction": bool(self.attach_faction.isChecked()),
-            "attach_rumors": bool(self.attach_rumors.isChecked()),
-            "rumor_count": int(self.rumor_count.value()),
-            "dungeon": {
-                "max_rooms": int(self.max_rooms.value()),
-                "corridor_density": int(self.corridor_density.value()),
-                "dead_end_prune": int(self.dead_end_prune.value()),
-                "cave_mode": bool(self.cave_mode.isChecked()),
-                "secret_doors": int(self.secret_doors.value()),
-                "secret_corridors": int(self.secret_corridors.value()),
-            },
-            "split_scratchpad": bool(self.split_scratchpad.isChecked()),
-        }
+        state = {"version": 1, "generate_count": int(self._generate_count)}
+        state.update({k: get() for k, get in self._state_spec})
+        state["dungeon"] = {k: get() for k, get in self._dungeon_state_spec}
+        return state
 
     def load_state(self, state: dict) -> None:
         state = state or {}
@@ -268,13 +282,7 @@ class LocationStackWidget(QWidget):
         except Exception: pass
 
         d = state.get("dungeon", {}) or {}
-        for key, widget in [
-            ("max_rooms", self.max_rooms),
-            ("corridor_density", self.corridor_density),
-            ("dead_end_prune", self.dead_end_prune),
-            ("secret_doors", self.secret_doors),
-            ("secret_corridors", self.secret_corridors),
-        ]:
+        for key, widget in self._dungeon_spins:
             try:
                 widget.setValue(int(d.get(key, widget.value())))
             except Exception:
@@ -1,30 +1,41 @@
 from __future__ import annotations
 
+import json
+import os
+import re
 from pathlib import Path
 from typing import Optional
 
 from .generator import MagicItem
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+_SLUG_DROP = re.compile(r"[^\w \-]")
+_DASH_RUN = re.compile(r"[ _\-]+")
+
 
 def _safe_slug(text: str) -> str:
-    # Simple slugging (no external deps)
-    keep = []
-    for ch in text.lower():
-        if ch.isalnum():
-            keep.append(ch)
-        elif ch in (" ", "-", "_"):
-            keep.append("-")
-    slug = "".join(keep)
-    while "--" in slug:
-        slug = slug.replace("--", "-")
+    # Simple slugging (no external deps): drop punctuation, collapse separators
+    slug = _DASH_RUN.sub("-", _SLUG_DROP.sub("", text.lower()))
     return slug.strip("-")[:60] or "magic-item"
 
 
-def export_magic_item(ctx, item: MagicItem, *, as_session_pack: bool = True) -> Path:
+def export_magic_item(
+    ctx,
+    item: MagicItem,
+    *,
+    as_session_pack: bool = True,
+    markdown: Optional[str] = None,
+) -> Path:
     """
     Writes export artifacts for the item.
     Preferred: session pack folder containing item.md + item.txt + item.json
     Fallback: ctx.export_path(...) if export_manager isn't present.
+    Pass markdown to reuse an already-rendered item.to_markdown().
     """
     slug = _safe_slug(item.name)
 
@@ -45,7 +56,6 @@ def export_magic_item(ctx, item: MagicItem, *, as_session_pack: bool = True) ->
         except Exception:
             # Last resort: project_root/exports/magicitem
             base = Path(getattr(ctx, "project_root", ".")) / "exports" / "magicitem"
-        base.mkdir(parents=True, exist_ok=True)
         pack_dir = base / f"{slug}_seed{item.seed}"
         pack_dir.mkdir(parents=True, exist_ok=True)
 
@@ -53,8 +63,16 @@ def export_magic_item(ctx, item: MagicItem, *, as_session_pack: bool = True) ->
     txt_path = pack_dir / "item.txt"
     json_path = pack_dir / "item.json"
 
-    md_path.write_text(item.to_markdown(), encoding="utf-8")
-    txt_path.write_text(item.to_markdown(), encoding="utf-8")  # plain text is fine as md
-    json_path.write_text(__import__("json").dumps(item.to_dict(), indent=2), encoding="utf-8")
+    md = markdown or item.to_markdown()
+    md_path.write_text(md, encoding="utf-8")
+    # plain text is fine as md: hardlink it instead of writing the same bytes twice
+    try:
+        os.link(md_path, txt_path)
+    except OSError:
+        txt_path.write_text(md, encoding="utf-8")
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(item.to_dict(), option=orjson.OPT_INDENT_2))
+    else:
+        json_path.write_bytes(json.dumps(item.to_dict(), indent=2, ensure_ascii=False).encode("utf-8"))
 
     return pack_dir
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from bisect import bisect_left
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from itertools import accumulate
+import time
+from typing import Dict, Any, List, Optional, Tuple
 
 from . import tables
 
@@ -25,7 +28,23 @@ class MagicItem:
     created_utc: str
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat record of str/int fields: skip asdict()'s recursive deepcopy.
+        return {
+            "name": self.name,
+            "item_type": self.item_type,
+            "theme": self.theme,
+            "rarity": self.rarity,
+            "power_tier": self.power_tier,
+            "effect_category": self.effect_category,
+            "effect": self.effect,
+            "drawback_type": self.drawback_type,
+            "drawback": self.drawback,
+            "quirk": self.quirk,
+            "origin": self.origin,
+            "twist": self.twist,
+            "seed": self.seed,
+            "created_utc": self.created_utc,
+        }
 
     def to_markdown(self) -> str:
         # Keep it GM-ready, printable, and scratchpad-friendly.
@@ -46,35 +65,47 @@ class MagicItem:
         )
 
 
+_last_iso_sec = -1
+_last_iso = ""
+
+
 def _now_utc_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    # Second resolution, so reuse the formatted string until the clock ticks over.
+    global _last_iso_sec, _last_iso
+    sec = int(time.time())
+    if sec != _last_iso_sec:
+        _last_iso = datetime.fromtimestamp(sec, timezone.utc).isoformat()
+        _last_iso_sec = sec
+    return _last_iso
 
 
 def _pick(rng, seq):
     return seq[rng.randrange(0, len(seq))]
 
 
+_POWER_TIER_NAMES = tuple(name for name, _ in tables.POWER_TIERS)
+
+
+def _build_power_cdf(power: int) -> Tuple[Tuple[int, ...], int]:
+    # Map to a "target tier" 0..4
+    target = max(0, min(4, round((power / 100) * 4)))
+    # weights favor target, but allow neighbors: 5,3,1,1,1 shape
+    cdf = tuple(accumulate(max(1, 5 - 2 * abs(i - target)) for i in range(5)))
+    return cdf, cdf[-1]
+
+
+# The power slider is 0..100, so every cumulative weight table is known up front.
+_POWER_CDF = {p: _build_power_cdf(p) for p in range(101)}
+
+
 def _pick_weighted_power(rng, power: int) -> str:
     """
     power: 0..100 slider
     Bias toward higher tiers when power is high.
     """
-    # Map to a "target tier" 0..4
-    target = max(0, min(4, round((power / 100) * 4)))
-    # weights favor target, but allow neighbors
-    weights = [1, 1, 1, 1, 1]
-    for i in range(5):
-        dist = abs(i - target)
-        weights[i] = max(1, 5 - 2 * dist)  # 5,3,1,1,1 shape
-    # draw
-    total = sum(weights)
+    cdf, total = _POWER_CDF.get(power) or _build_power_cdf(power)
     roll = rng.randrange(1, total + 1)
-    acc = 0
-    for i, w in enumerate(weights):
-        acc += w
-        if roll <= acc:
-            return tables.POWER_TIERS[i][0]
-    return tables.POWER_TIERS[target][0]
+    return _POWER_TIER_NAMES[bisect_left(cdf, roll)]
 
 
 def _curse_chance(risk: int, allow_curse: bool) -> bool:
@@ -98,8 +129,21 @@ def _name(rng) -> str:
     # 70% include epithet
     if rng.random() < 0.7:
         epithet = _pick(rng, tables.NAME_EPITHET)
-        return f"{prefix} {noun} {epithet}"
-    return f"{prefix} {noun}"
+        return " ".join((prefix, noun, epithet))
+    return prefix + " " + noun
+
+
+_WEIRD_CATEGORIES = ("Time/Fate", "Planar", "Transformation", "Environment")
+
+
+def _effects_by_category():
+    grouped: Dict[str, List[tuple]] = {}
+    for entry in tables.EFFECTS:
+        grouped.setdefault(entry[0], []).append(entry)
+    return grouped
+
+
+_EFFECTS_BY_CATEGORY = _effects_by_category()
 
 
 def generate_magic_item(
@@ -122,12 +166,12 @@ def generate_magic_item(
 
     # Effects: bias toward “weirder” categories as weirdness rises
     if rng.random() < (weirdness / 100) * 0.35:
-        category = _pick(rng, ["Time/Fate", "Planar", "Transformation", "Environment"])
+        category = _pick(rng, _WEIRD_CATEGORIES)
     else:
         category = _pick(rng, tables.EFFECT_CATEGORIES)
 
     # pick effect from category if possible
-    matching = [e for e in tables.EFFECTS if e[0] == category]
+    matching = _EFFECTS_BY_CATEGORY.get(category)
     if not matching:
         matching = tables.EFFECTS
     effect_category, effect = _pick(rng, matching)
@@ -159,3 +203,79 @@ def generate_magic_item(
         seed=seed_used,
         created_utc=_now_utc_iso(),
     )
+
+
+def generate_magic_items(
+    rng,
+    n: int,
+    *,
+    theme: Optional[str] = None,
+    item_type: Optional[str] = None,
+    power: int = 50,
+    risk: int = 50,
+    weirdness: int = 50,
+    allow_curse: bool = True,
+    rarity: Optional[str] = None,
+    seed_used: int = 0,
+) -> List[MagicItem]:
+    """
+    Bulk variant of generate_magic_item.
+    Draws each field for all n items in one rng.choices() call instead of
+    one draw per field per item; the per-item work is just zipping columns.
+    """
+    if n <= 0:
+        return []
+
+    choices = rng.choices
+    themes = [theme] * n if theme else choices(tables.THEMES, k=n)
+    item_types = [item_type] * n if item_type else choices(tables.ITEM_TYPES, k=n)
+    rarities = [rarity] * n if rarity else choices(tables.RARITIES, k=n)
+
+    cdf, _ = _POWER_CDF.get(power) or _build_power_cdf(power)
+    power_tiers = choices(_POWER_TIER_NAMES, cum_weights=cdf, k=n)
+
+    weird_p = (weirdness / 100) * 0.35
+    categories = [
+        choices(_WEIRD_CATEGORIES)[0] if rng.random() < weird_p else c
+        for c in choices(tables.EFFECT_CATEGORIES, k=n)
+    ]
+    effects = [choices(_EFFECTS_BY_CATEGORY.get(c) or tables.EFFECTS)[0] for c in categories]
+
+    drawbacks = choices(tables.DRAWBACKS, k=n)
+    quirks = choices(tables.QUIRKS, k=n)
+    origins = choices(tables.ORIGINS, k=n)
+
+    twist_p = (weirdness / 100) * 0.25
+    twists = [
+        f"{t} Also: {choices(tables.TWISTS)[0]}" if rng.random() < twist_p else t
+        for t in choices(tables.TWISTS, k=n)
+    ]
+
+    prefixes = choices(tables.NAME_PREFIX, k=n)
+    nouns = choices(tables.NAME_NOUN, k=n)
+    epithets = choices(tables.NAME_EPITHET, k=n)
+    names = [
+        " ".join((p, no, ep)) if rng.random() < 0.7 else p + " " + no
+        for p, no, ep in zip(prefixes, nouns, epithets)
+    ]
+
+    created = _now_utc_iso()
+    return [
+        MagicItem(
+            name=names[i],
+            item_type=item_types[i],
+            theme=themes[i],
+            rarity=rarities[i],
+            power_tier=power_tiers[i],
+            effect_category=effects[i][0],
+            effect=effects[i][1],
+            drawback_type=drawbacks[i][0],
+            drawback=drawbacks[i][1],
+            quirk=quirks[i],
+            origin=origins[i],
+            twist=twists[i],
+            seed=seed_used,
+            created_utc=created,
+        )
+        for i in range(n)
+    ]
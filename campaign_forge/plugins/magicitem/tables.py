@@ -5,39 +5,41 @@ Designed to be:
 - system-agnostic (OSR-friendly)
 - flavorful, not math-heavy
 - easily expandable
+
+Tables are tuples: they are read-only at runtime.
 """
 
-THEMES = [
+THEMES = (
     "Grim Relics", "Weird Arcana", "Fae Bargains", "Holy Remnants", "Demon-Forged",
     "Stormcraft", "Deep Dungeons", "Necromantic", "Witchcraft", "Planar Oddities",
     "Clockwork", "Mythic", "Forbidden Lore",
-]
+)
 
-ITEM_TYPES = [
+ITEM_TYPES = (
     "Weapon", "Armor", "Shield", "Wand", "Staff", "Ring", "Amulet", "Cloak",
     "Boots", "Helm", "Belt", "Gloves", "Tool", "Book", "Idol", "Key", "Consumable",
     "Wondrous Item", "Relic", "Artifact",
-]
+)
 
-POWER_TIERS = [
+POWER_TIERS = (
     ("Trivial", 0),
     ("Useful", 1),
     ("Dangerous", 2),
     ("World-altering", 3),
     ("Catastrophic", 4),
-]
+)
 
-RARITIES = [
+RARITIES = (
     "Common", "Uncommon", "Rare", "Singular", "Mythic",
-]
+)
 
-EFFECT_CATEGORIES = [
+EFFECT_CATEGORIES = (
     "Combat", "Movement", "Survival", "Information", "Social", "Summoning",
     "Transformation", "Time/Fate", "Planar", "Environment",
-]
+)
 
 # Each entry is (category, effect_text)
-EFFECTS = [
+EFFECTS = (
     ("Combat", "Cuts through non-living matter as if it were soft wood (stone, iron, bone)."),
     ("Combat", "Marks a target you can see; allies can track it unerringly for a day."),
     ("Combat", "Once per fight, ignore the first injury you would take—then feel it after the fight ends."),
@@ -64,9 +66,9 @@ EFFECTS = [
     ("Planar", "Makes sacred ground feel like home, and home feel… distant."),
     ("Environment", "Causes plants to grow toward you; doors swell, ropes tighten, roots creep."),
     ("Environment", "Silences an area briefly; afterwards sound returns as a violent echo."),
-]
+)
 
-QUIRKS = [
+QUIRKS = (
     "Always slightly warm, like it was held near a fire.",
     "Smells of ozone before danger.",
     "Animals avoid the bearer unless fed first.",
@@ -77,9 +79,9 @@ QUIRKS = [
     "Grows cold near lies.",
     "Hums when pointed at something valuable.",
     "Its shadow moves a fraction behind your own.",
-]
+)
 
-DRAWBACKS = [
+DRAWBACKS = (
     ("Physical", "Each use steals a little heat: your fingers go numb until you rest."),
     ("Physical", "After using it, you cough up black dust for an hour."),
     ("Social", "People feel watched around you; hospitality becomes expensive."),
@@ -94,9 +96,9 @@ DRAWBACKS = [
     ("Environmental", "Candles gutter and die when you draw it."),
     ("Consumption", "It must be ‘fed’ something small: a coin, a secret, a drop of blood."),
     ("Consumption", "It eats written words: the next page you read becomes blank."),
-]
+)
 
-ORIGINS = [
+ORIGINS = (
     "Forged from the broken crown of a drowned king.",
     "Woven from hair stolen from a sleeping saint.",
     "Carved from a meteorite that sang as it fell.",
@@ -107,10 +109,10 @@ ORIGINS = [
     "Gifted by the fae as payment for a promise you don’t remember making.",
     "Recovered from a sealed vault labeled ONLY: ‘DO NOT WIN.’",
     "Once belonged to the last explorer of a map that eats itself.",
-]
+)
 
 # Some "twists" give the generator punch without needing hard rules.
-TWISTS = [
+TWISTS = (
     "The benefit is real, but it always leaves evidence.",
     "It works flawlessly—until you use it for selfish reasons.",
     "It’s strongest when you’re afraid.",
@@ -119,21 +121,21 @@ TWISTS = [
     "It’s being used by someone else at the same time, somewhere far away.",
     "It ‘learns’ from you and becomes more like you (for good or ill).",
     "It is quietly replacing something in your life.",
-]
+)
 
 # “Name bits” for a simple but effective naming system.
-NAME_PREFIX = [
+NAME_PREFIX = (
     "Ashen", "Gilded", "Hollow", "Sable", "Radiant", "Veil", "Iron", "Ivory",
     "Sorrow", "Mercy", "Thorn", "Wound", "Cinder", "Moon", "Root", "Oath",
     "Grave", "Whisper", "Gale", "Witch",
-]
-NAME_NOUN = [
+)
+NAME_NOUN = (
     "Key", "Crown", "Lantern", "Blade", "Bell", "Mask", "Chain", "Mirror",
     "Needle", "Cup", "Book", "Stone", "Ring", "Cloak", "Compass", "Chime",
     "Seal", "Coin", "Bone", "Thread",
-]
-NAME_EPITHET = [
+)
+NAME_EPITHET = (
     "of the Third Dawn", "of Unquiet Waters", "of Borrowed Breath", "of the Last Door",
     "of the Pale Court", "of the Devouring Map", "of Black Candles", "of the Quiet War",
     "of Waking Regret", "of Saints That Lie", "of the Crooked Star", "of the Witch Road",
-]
+)
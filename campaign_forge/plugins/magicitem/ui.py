@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import hashlib
+import random
 import traceback
+from dataclasses import fields
+from functools import lru_cache
 
 # Try common Qt bindings; Campaign Forge is Qt-based, but projects vary.
 try:
@@ -8,19 +12,61 @@ try:
         QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
         QComboBox, QCheckBox, QSlider, QTextEdit, QMessageBox, QGroupBox
     )
-    from PySide6.QtCore import Qt
+    from PySide6.QtCore import Qt, QTimer
 except Exception:  # pragma: no cover
     from PyQt5.QtWidgets import (
         QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
         QComboBox, QCheckBox, QSlider, QTextEdit, QMessageBox, QGroupBox
     )
-    from PyQt5.QtCore import Qt
+    from PyQt5.QtCore import Qt, QTimer
 
 from . import tables
 from .generator import generate_magic_item, MagicItem
 from .exports import export_magic_item
 
 
+@lru_cache(maxsize=256)
+def _stable_int_seed(master_seed: int, *parts) -> int:
+    # Stable, cross-run derivation without Python's randomized hash():
+    s = str(master_seed) + "|" + "|".join(map(str, parts))
+    # 32-bit blake2b digest: hashed in C rather than a per-character Python loop
+    return int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+# Combo contents (with their "Any" entry) and text -> index maps, shared by all widgets
+_THEMES = ("Any Theme", *tables.THEMES)
+_TYPES = ("Any Type", *tables.ITEM_TYPES)
+_RARITIES = ("Any Rarity", *tables.RARITIES)
+_THEME_IDX = {t: i for i, t in enumerate(_THEMES)}
+_TYPE_IDX = {t: i for i, t in enumerate(_TYPES)}
+_RARITY_IDX = {t: i for i, t in enumerate(_RARITIES)}
+
+_ITEM_FIELDS = tuple(f.name for f in fields(MagicItem))
+
+
+def _rehydrate(cls, d: dict, names: tuple):
+    """
+    Rebuild a saved dataclass without re-running __init__.
+    Unknown keys are ignored; returns None if a field is missing.
+    """
+    if any(n not in d for n in names):
+        return None
+    obj = object.__new__(cls)
+    obj.__dict__.update({n: d[n] for n in names})
+    return obj
+
+
+def _item_tags(item: MagicItem) -> tuple:
+    return (
+        "MagicItem",
+        "Treasure",
+        f"Rarity:{item.rarity}",
+        f"Type:{item.item_type}",
+        # optional theme tag
+        *((f"Theme:{item.theme}",) if item.theme else ()),
+    )
+
+
 def _int_slider(minv=0, maxv=100, val=50):
     s = QSlider(Qt.Horizontal)
     s.setMinimum(minv)
@@ -43,10 +89,15 @@ class MagicItemWidget(QWidget):
         super().__init__()
         self.ctx = ctx
         self.plugin_id = "magicitem"
+        # Resolve the logger once; call sites skip formatting work when there is none.
+        log = getattr(ctx, "log", None)
+        self._log_fn = log if callable(log) else None
 
         self.generate_count = 0
         self.last_item: MagicItem | None = None
         self.last_seed_used: int = 0
+        self._last_md: str | None = None  # rendered markdown of last_item
+        self._last_tags: tuple | None = None  # scratchpad tags of last_item
 
         self._build_ui()
 
@@ -65,19 +116,13 @@ class MagicItemWidget(QWidget):
 
         row1 = QHBoxLayout()
         self.cmb_theme = QComboBox()
-        self.cmb_theme.addItem("Any Theme")
-        for t in tables.THEMES:
-            self.cmb_theme.addItem(t)
+        self.cmb_theme.addItems(_THEMES)
 
         self.cmb_type = QComboBox()
-        self.cmb_type.addItem("Any Type")
-        for it in tables.ITEM_TYPES:
-            self.cmb_type.addItem(it)
+        self.cmb_type.addItems(_TYPES)
 
         self.cmb_rarity = QComboBox()
-        self.cmb_rarity.addItem("Any Rarity")
-        for r in tables.RARITIES:
-            self.cmb_rarity.addItem(r)
+        self.cmb_rarity.addItems(_RARITIES)
 
         row1.addWidget(QLabel("Theme:"))
         row1.addWidget(self.cmb_theme, 2)
@@ -136,7 +181,13 @@ class MagicItemWidget(QWidget):
         self.txt_preview.setPlaceholderText("Generated item will appear here…")
         root.addWidget(self.txt_preview, 1)
 
-        # Generate an initial item for “instant gratification”
+        # Generate an initial item for “instant gratification”, after the first paint
+        QTimer.singleShot(0, self._initial_generate)
+
+    def _initial_generate(self):
+        # load_state may have run before this fired; don't clobber a restored item.
+        if self.last_item is not None or self.txt_preview.toPlainText():
+            return
         try:
             self.on_generate()
         except Exception:
@@ -153,35 +204,20 @@ class MagicItemWidget(QWidget):
         """
         master = getattr(self.ctx, "master_seed", 0) or 0
         iteration = self.generate_count
+        # Stable seed value to display; both branches below share it.
+        seed_used = _stable_int_seed(master, self.plugin_id, "generate", iteration)
 
         # Preferred: ctx.derive_rng
         derive = getattr(self.ctx, "derive_rng", None)
         if callable(derive):
             try:
-                rng = derive(master, self.plugin_id, "generate", iteration)
-                # Try to also compute a stable seed value to display
-                # If ctx exposes a stable seed helper, use it; else hash-like derivation.
-                seed_used = self._stable_int_seed(master, self.plugin_id, "generate", iteration)
-                return rng, seed_used
+                return derive(master, self.plugin_id, "generate", iteration), seed_used
             except Exception:
                 pass
 
         # Fallback: Random(seed)
-        import random
-        seed_used = self._stable_int_seed(master, self.plugin_id, "generate", iteration)
         return random.Random(seed_used), seed_used
 
-    @staticmethod
-    def _stable_int_seed(master_seed: int, *parts) -> int:
-        # Stable, cross-run derivation without Python's randomized hash():
-        s = str(master_seed) + "|" + "|".join(map(str, parts))
-        # Simple 32-bit FNV-1a style
-        h = 2166136261
-        for ch in s:
-            h ^= ord(ch)
-            h = (h * 16777619) & 0xFFFFFFFF
-        return int(h)
-
     # ---------- Actions ----------
 
     def on_generate(self):
@@ -214,43 +250,53 @@ class MagicItemWidget(QWidget):
                 seed_used=seed_used,
             )
             self.last_item = item
-            self.txt_preview.setPlainText(item.to_markdown())
+            self._last_md = item.to_markdown()
+            self._last_tags = _item_tags(item)
+            # setPlainText relayouts the whole document; skip it when nothing changed
+            if self._last_md != self.txt_preview.toPlainText():
+                self.txt_preview.setPlainText(self._last_md)
 
             self._log(f"[MagicItem] Generated: {item.name} (seed {seed_used})")
         except Exception as e:
             self._log(f"[MagicItem] ERROR generating item: {e}")
-            self._log(traceback.format_exc())
+            if self._log_fn is not None:
+                self._log(traceback.format_exc())
 
     def on_send_to_scratchpad(self):
         if not self.last_item:
             return
         try:
-            text = self.last_item.to_markdown()
-            tags = ["MagicItem", "Treasure", f"Rarity:{self.last_item.rarity}", f"Type:{self.last_item.item_type}"]
-            # optional theme tag
-            if self.last_item.theme:
-                tags.append(f"Theme:{self.last_item.theme}")
+            text = self._last_md or self.last_item.to_markdown()
+            tags = self._last_tags or _item_tags(self.last_item)
 
             add = getattr(self.ctx, "scratchpad_add", None)
             if callable(add):
                 add(text=text, tags=tags)
-                self._log(f"[MagicItem] Sent to scratchpad with tags: {', '.join(tags)}")
+                if self._log_fn is not None:
+                    self._log(f"[MagicItem] Sent to scratchpad with tags: {', '.join(tags)}")
             else:
                 self._log("[MagicItem] Scratchpad service not available on ctx.")
         except Exception as e:
             self._log(f"[MagicItem] ERROR sending to scratchpad: {e}")
-            self._log(traceback.format_exc())
+            if self._log_fn is not None:
+                self._log(traceback.format_exc())
 
     def on_export(self):
         if not self.last_item:
             return
         try:
-            pack_dir = export_magic_item(self.ctx, self.last_item, as_session_pack=self.chk_session_pack.isChecked())
+            pack_dir = export_magic_item(
+                self.ctx,
+                self.last_item,
+                as_session_pack=self.chk_session_pack.isChecked(),
+                markdown=self._last_md,
+            )
             self._log(f"[MagicItem] Exported to: {pack_dir}")
             QMessageBox.information(self, "Export Complete", f"Exported to:\n{pack_dir}")
         except Exception as e:
             self._log(f"[MagicItem] ERROR exporting: {e}")
-            self._log(traceback.format_exc())
+            if self._log_fn is not None:
+                self._log(traceback.format_exc())
             QMessageBox.warning(self, "Export Failed", str(e))
 
     # ---------- Persistence ----------
@@ -286,15 +332,27 @@ class MagicItemWidget(QWidget):
                 self._log(f"[MagicItem] Unknown state version: {ver} (loading best-effort)")
 
             ui = state.get("ui", {})
-            self._set_combo_text(self.cmb_theme, ui.get("theme", "Any Theme"))
-            self._set_combo_text(self.cmb_type, ui.get("type", "Any Type"))
-            self._set_combo_text(self.cmb_rarity, ui.get("rarity", "Any Rarity"))
-
-            self.sld_power.setValue(int(ui.get("power", 55)))
-            self.sld_risk.setValue(int(ui.get("risk", 50)))
-            self.sld_weird.setValue(int(ui.get("weird", 55)))
-            self.chk_curse.setChecked(bool(ui.get("allow_curse", True)))
-            self.chk_session_pack.setChecked(bool(ui.get("session_pack", True)))
+            # Restore knobs without a signal per setter.
+            knobs = (
+                self.cmb_theme, self.cmb_type, self.cmb_rarity,
+                self.sld_power, self.sld_risk, self.sld_weird,
+                self.chk_curse, self.chk_session_pack,
+            )
+            for w in knobs:
+                w.blockSignals(True)
+            try:
+                self._set_combo_text(self.cmb_theme, _THEME_IDX, ui.get("theme", "Any Theme"))
+                self._set_combo_text(self.cmb_type, _TYPE_IDX, ui.get("type", "Any Type"))
+                self._set_combo_text(self.cmb_rarity, _RARITY_IDX, ui.get("rarity", "Any Rarity"))
+
+                self.sld_power.setValue(int(ui.get("power", 55)))
+                self.sld_risk.setValue(int(ui.get("risk", 50)))
+                self.sld_weird.setValue(int(ui.get("weird", 55)))
+                self.chk_curse.setChecked(bool(ui.get("allow_curse", True)))
+                self.chk_session_pack.setChecked(bool(ui.get("session_pack", True)))
+            finally:
+                for w in knobs:
+                    w.blockSignals(False)
 
             data = state.get("data", {})
             self.generate_count = int(data.get("generate_count", 0))
@@ -302,32 +360,32 @@ class MagicItemWidget(QWidget):
 
             last_preview = data.get("last_preview")
             if isinstance(last_preview, str) and last_preview.strip():
-                self.txt_preview.setPlainText(last_preview)
+                if last_preview != self.txt_preview.toPlainText():
+                    self.txt_preview.setPlainText(last_preview)
 
             # Attempt to restore last_item minimally (optional)
             li = data.get("last_item")
             if isinstance(li, dict) and li.get("name"):
-                try:
-                    self.last_item = MagicItem(**li)
-                except Exception:
-                    self.last_item = None
+                self.last_item = _rehydrate(MagicItem, li, _ITEM_FIELDS)
+                self._last_md = None
+                self._last_tags = None
 
         except Exception as e:
             self._log(f"[MagicItem] ERROR loading state: {e}")
-            self._log(traceback.format_exc())
+            if self._log_fn is not None:
+                self._log(traceback.format_exc())
 
     @staticmethod
-    def _set_combo_text(combo: QComboBox, text: str):
+    def _set_combo_text(combo: QComboBox, index_map: dict, text: str):
         if not text:
             return
-        idx = combo.findText(text)
+        idx = index_map.get(text, -1)
         if idx >= 0:
             combo.setCurrentIndex(idx)
 
     # ---------- Logging ----------
 
     def _log(self, msg: str):
-        log = getattr(self.ctx, "log", None)
-        if callable(log):
-            log(msg)
+        if self._log_fn is not None:
+            self._log_fn(msg)
         # If no logger exists, we silently do nothing—do not print spam.
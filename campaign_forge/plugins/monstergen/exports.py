@@ -3,37 +3,39 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, Any
-from .generator import Monster, monster_to_markdown
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from operator import attrgetter
+from typing import Dict, Any, List
+from .generator import Monster, MonsterAbility, monster_to_markdown
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+_ABILITY_KEYS = ("name", "text", "category")
+_ability_fields = attrgetter(*_ABILITY_KEYS)
+
+
+def _serialize_abilities(abilities: List[MonsterAbility]) -> List[Dict[str, str]]:
+    return [dict(zip(_ABILITY_KEYS, _ability_fields(a))) for a in abilities]
+
+
+# Walk the dataclass fields once at import; only creature_type is renamed in the JSON.
+_JSON_RENAMES = {"creature_type": "type"}
+_ABILITY_LISTS = {"traits", "actions", "reactions", "legendary_actions"}
+_MONSTER_FIELDS = tuple(
+    (f.name, _JSON_RENAMES.get(f.name, f.name), f.name in _ABILITY_LISTS) for f in fields(Monster)
+)
 
 
 def monster_to_json_dict(mon: Monster) -> Dict[str, Any]:
+    # Direct field dump (no asdict deepcopy); nested abilities become plain dicts.
     return {
-        "name": mon.name,
-        "size": mon.size,
-        "type": mon.creature_type,
-        "alignment": mon.alignment,
-        "ac": mon.ac,
-        "hp": mon.hp,
-        "hit_dice": mon.hit_dice,
-        "speed": mon.speed,
-        "stats": mon.stats,
-        "saves": mon.saves,
-        "skills": mon.skills,
-        "senses": mon.senses,
-        "languages": mon.languages,
-        "cr": mon.cr,
-        "xp": mon.xp,
-        "proficiency_bonus": mon.proficiency_bonus,
-        "vulnerabilities": mon.vulnerabilities,
-        "damage_resistances": mon.damage_resistances,
-        "damage_immunities": mon.damage_immunities,
-        "condition_immunities": mon.condition_immunities,
-        "traits": [{"name": t.name, "text": t.text, "category": t.category} for t in mon.traits],
-        "actions": [{"name": a.name, "text": a.text, "category": a.category} for a in mon.actions],
-        "reactions": [{"name": r.name, "text": r.text, "category": r.category} for r in mon.reactions],
-        "legendary_actions": [{"name": la.name, "text": la.text, "category": la.category} for la in mon.legendary_actions],
-        "audit": mon.audit,
+        key: _serialize_abilities(getattr(mon, name)) if nested else getattr(mon, name)
+        for name, key, nested in _MONSTER_FIELDS
     }
 
 
@@ -49,14 +51,28 @@ def export_monster_session_pack(ctx, mon: Monster, seed_used: int):
     json_path = pack_dir / "monster.json"
     readme_path = pack_dir / "README.txt"
 
-    md_path.write_text(monster_to_markdown(mon), encoding="utf-8")
-    json_path.write_text(json.dumps(monster_to_json_dict(mon), indent=2), encoding="utf-8")
-    readme_path.write_text(
+    # Encode each payload once up front so the pool only does I/O.
+    md_bytes = monster_to_markdown(mon).encode("utf-8")
+    payload = monster_to_json_dict(mon)
+    if orjson is not None:
+        json_bytes = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        json_bytes = json.dumps(payload, indent=2).encode("utf-8")
+    readme_bytes = (
         f"Campaign Forge - Monster Generator export\n"
         f"Name: {mon.name}\n"
         f"CR: {mon.cr}\n"
-        f"Seed: {seed_used}\n",
-        encoding="utf-8",
-    )
+        f"Seed: {seed_used}\n"
+    ).encode("utf-8")
+
+    # The three files are independent; overlap their writes (the GIL is released in write()).
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futures = [
+            ex.submit(md_path.write_bytes, md_bytes),
+            ex.submit(json_path.write_bytes, json_bytes),
+            ex.submit(readme_path.write_bytes, readme_bytes),
+        ]
+        for f in futures:
+            f.result()
 
     return pack_dir
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
-import math
+from typing import List, Dict, Optional, Sequence, Tuple, Union
 
 from .tables import (
     CREATURE_TYPES, SIZES, ALIGNMENTS, ROLES, DAMAGE_TYPES, CONDITIONS, SKILLS, SAVES,
-    proficiency_for_cr, CR_BANDS, ROLE_MODS,
+    proficiency_for_cr, CR_BANDS, BAND_CRS, ROLE_MODS,
     band_for_hp, band_for_dpr,
     TRAIT_LIBRARY, REACTION_LIBRARY, CONTROL_EFFECTS
 )
@@ -18,7 +18,7 @@ from .tables import (
 # Data models
 # ----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class MonsterAttack:
     name: str
     kind: str  # "Melee Weapon Attack", "Ranged Weapon Attack", "Melee or Ranged Weapon Attack"
@@ -27,16 +27,20 @@ class MonsterAttack:
     target: str
     damage: str
     rider: str = ""
+    name_lower: str = field(init=False, repr=False, compare=False)  # for multiattack text
 
+    def __post_init__(self):
+        self.name_lower = self.name.lower()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MonsterAbility:
     name: str
     text: str
     category: str = "Trait"  # Trait / Action / Bonus Action / Reaction / Legendary Action / Lair Action
 
 
-@dataclass
+@dataclass(slots=True)
 class Monster:
     name: str
     size: str
@@ -70,6 +74,96 @@ class Monster:
         return (score - 10) // 2
 
 
+# Library abilities are immutable, so every monster shares one instance per entry.
+_TRAIT_ABILITIES = tuple(MonsterAbility(name=t["name"], text=t["text"], category="Trait") for t in TRAIT_LIBRARY)
+_REACTION_ABILITIES = tuple(MonsterAbility(name=r["name"], text=r["text"], category="Reaction") for r in REACTION_LIBRARY)
+_INNATE_MAGIC = MonsterAbility(name="Innate Magic", text="The monster’s attacks are magical for the purpose of overcoming resistance and immunity to nonmagical attacks.", category="Trait")
+
+
+# ----------------------------
+# Option tables (tuples: built once, never mutated)
+# ----------------------------
+
+_STAT_KEYS = ("Str", "Dex", "Con", "Int", "Wis", "Cha")
+_LANGUAGES = ("Common", "Dwarvish", "Elvish", "Goblin", "Infernal", "Abyssal", "Draconic", "Celestial", "Sylvan", "Undercommon")
+_ELEMENTAL_IMMUNE = ("poison", "fire", "cold", "lightning")
+_DRAGON_IMMUNE = ("fire", "cold", "lightning", "poison", "acid")
+_CONSTRUCT_COND_IMMUNE = ("poisoned", "charmed", "exhaustion")
+_OOZE_COND_IMMUNE = ("blinded", "charmed", "deafened", "frightened", "prone")
+_WEAPON_DAMAGE_TYPES = ("slashing", "piercing", "bludgeoning", *DAMAGE_TYPES)
+_FLAT_BONUS = (2, 3)
+_ATTACK_NAMES_MELEE = ("Claw", "Bite", "Slam", "Glaive", "Scything Talon", "Warped Strike")
+_ATTACK_NAMES_RANGED = ("Shard Bolt", "Barbed Javelin", "Spine Volley", "Void Needle")
+_CONTROL_ACTION_NAMES = ("Warp Hex", "Binding Pulse", "Mind-Splinter", "Grasping Surge")
+_ADJ = ("Ashen", "Gutter", "Gleaming", "Wretched", "Umbral", "Verdant", "Howling", "Sable", "Ivory", "Rime", "Scorch", "Grim")
+_NOUNS = ("Stalker", "Husk", "Marauder", "Seer", "Behemoth", "Warden", "Reaver", "Sentinel", "Mireling", "Skirmisher", "Oracle", "Devourer")
+_EPITHETS = ("Deep", "Hollow", "Iron", "Thorn", "Wyrd", "Cinder")
+_TRUE_FALSE = (True, False)
+
+# (swings, mixes in a second attack) -> Multiattack text
+_MULTIATTACK_TEMPLATES = {
+    (2, False): "The monster makes 2 {n0} attacks.",
+    (3, False): "The monster makes 3 {n0} attacks.",
+    (2, True): "The monster makes 1 {n0} attack and one {n1} attack.",
+    (3, True): "The monster makes 2 {n0} attacks and one {n1} attack.",
+}
+
+# Role-driven stat tendencies; the bias keys double as each role's "primary" stats.
+_ROLE_STAT_BIAS = {
+    "Brute":      {"Str": 3, "Con": 3, "Dex": -1, "Int": -1},
+    "Skirmisher": {"Dex": 3, "Str": 1, "Con": 1, "Wis": 1},
+    "Artillery":  {"Dex": 2, "Int": 3, "Wis": 1, "Con": -1},
+    "Controller": {"Wis": 3, "Int": 2, "Dex": 1, "Str": -1},
+    "Support":    {"Wis": 3, "Cha": 2, "Con": 1, "Str": -1},
+    "Solo":       {"Con": 3, "Str": 2, "Dex": 1, "Wis": 1},
+}
+_ROLE_PRIMARIES = {role: tuple(bias) for role, bias in _ROLE_STAT_BIAS.items()}
+
+# creature type -> (alternate walking speed, chance of using it); everyone else walks 30 ft.
+_SPEED_BASE = {
+    "Beast": (40, 0.35), "Fey": (40, 0.35),
+    "Construct": (20, 0.6), "Ooze": (20, 0.6),
+    "Dragon": (40, 0.4), "Fiend": (40, 0.4), "Celestial": (40, 0.4),
+}
+
+_HIT_DIE_BY_SIZE = {
+    "Tiny": 4, "Small": 6, "Medium": 8, "Large": 10, "Huge": 12, "Gargantuan": 20
+}
+
+# Bias saves by type
+_SAVE_BIAS_BY_TYPE = {
+    "Undead": ("Wis", "Con"),
+    "Dragon": ("Dex", "Con", "Wis"),
+    "Fiend": ("Wis", "Cha"),
+    "Fey": ("Dex", "Wis"),
+    "Construct": ("Con", "Wis"),
+    "Beast": ("Dex", "Con"),
+    "Humanoid": ("Dex", "Wis"),
+}
+
+# Rough mapping of skills to abilities
+_SKILL_ABILITY = {
+    "Athletics": "Str",
+    "Acrobatics": "Dex",
+    "Sleight of Hand": "Dex",
+    "Stealth": "Dex",
+    "Arcana": "Int",
+    "History": "Int",
+    "Investigation": "Int",
+    "Nature": "Int",
+    "Religion": "Int",
+    "Animal Handling": "Wis",
+    "Insight": "Wis",
+    "Medicine": "Wis",
+    "Perception": "Wis",
+    "Survival": "Wis",
+    "Deception": "Cha",
+    "Intimidation": "Cha",
+    "Performance": "Cha",
+    "Persuasion": "Cha",
+}
+
+
 # ----------------------------
 # Helpers
 # ----------------------------
@@ -78,7 +172,7 @@ def clamp(n, a, b):
     return max(a, min(b, n))
 
 def choose(rng, seq):
-    return seq[rng.randrange(0, len(seq))]
+    return seq[rng.randrange(len(seq))]
 
 def chance(rng, p: float) -> bool:
     return rng.random() < p
@@ -89,23 +183,53 @@ def fmt_signed(n: int) -> str:
 def avg_die(die: int) -> float:
     return (die + 1) / 2.0
 
+# Standard 5e XP table (common reference). Using a typical mapping.
+# This is stable enough for a generator; exactness is not mission-critical.
+_XP_TABLE = {
+    0: 10, 0.125: 25, 0.25: 50, 0.5: 100,
+    1: 200, 2: 450, 3: 700, 4: 1100, 5: 1800,
+    6: 2300, 7: 2900, 8: 3900, 9: 5000, 10: 5900,
+    11: 7200, 12: 8400, 13: 10000, 14: 11500, 15: 13000,
+    16: 15000, 17: 18000, 18: 20000, 19: 22000, 20: 25000,
+    21: 33000, 22: 41000, 23: 50000, 24: 62000, 25: 75000,
+    26: 90000, 27: 105000, 28: 120000, 29: 135000, 30: 155000,
+}
+_CR_KEYS = tuple(sorted(_XP_TABLE))
+_XP_VALUES = tuple(_XP_TABLE[k] for k in _CR_KEYS)
+_BAND_BY_CR = {r[0]: r for r in CR_BANDS}
+
+def _nearest_index(keys: Tuple[float, ...], cr: float) -> int:
+    # Index of the sorted key closest to cr; ties go to the lower key.
+    i = bisect_left(keys, cr)
+    if i == 0:
+        return 0
+    if i == len(keys):
+        return i - 1
+    return i if keys[i] - cr < cr - keys[i - 1] else i - 1
+
 def xp_for_cr(cr: float) -> int:
-    # Standard 5e XP table (common reference). Using a typical mapping.
-    # This is stable enough for a generator; exactness is not mission-critical.
-    table = {
-        0: 10, 0.125: 25, 0.25: 50, 0.5: 100,
-        1: 200, 2: 450, 3: 700, 4: 1100, 5: 1800,
-        6: 2300, 7: 2900, 8: 3900, 9: 5000, 10: 5900,
-        11: 7200, 12: 8400, 13: 10000, 14: 11500, 15: 13000,
-        16: 15000, 17: 18000, 18: 20000, 19: 22000, 20: 25000,
-        21: 33000, 22: 41000, 23: 50000, 24: 62000, 25: 75000,
-        26: 90000, 27: 105000, 28: 120000, 29: 135000, 30: 155000,
-    }
     # snap to nearest key
-    keys = sorted(table.keys(), key=lambda x: abs(x - cr))
-    return table[keys[0]]
+    return _XP_VALUES[_nearest_index(_CR_KEYS, cr)]
+
+def _band_for_cr(target_cr: float) -> tuple:
+    # Closest CR band row to target_cr. Table CRs (the common case) are a single dict hit;
+    # off-table values such as averaged audit CRs fall back to bisect.
+    row = _BAND_BY_CR.get(target_cr)
+    if row is None:
+        row = CR_BANDS[_nearest_index(BAND_CRS, target_cr)]
+    return row
+
+# Every label the CR picker offers, both ways round. Off-list values fall through to parsing.
+_CR_PARSE: Dict[str, float] = {
+    "0": 0.0, "1/8": 0.125, "1/4": 0.25, "1/2": 0.5,
+    **{str(i): float(i) for i in range(1, 31)},
+}
+_CR_LABEL: Dict[float, str] = {v: k for k, v in _CR_PARSE.items()}
 
 def cr_label(cr: float) -> str:
+    label = _CR_LABEL.get(cr)
+    if label is not None:
+        return label
     if cr == 0.125:
         return "1/8"
     if cr == 0.25:
@@ -117,6 +241,9 @@ def cr_label(cr: float) -> str:
     return str(cr)
 
 def parse_cr_label(label: str) -> float:
+    cr = _CR_PARSE.get(label)
+    if cr is not None:
+        return cr
     label = str(label).strip()
     if label == "1/8":
         return 0.125
@@ -133,16 +260,9 @@ def ability_scores_for_role(rng, cr: float, role: str) -> Dict[str, int]:
     # Role-driven stat tendencies + CR scaling.
     # We generate "reasonable" monster arrays; GM can edit after.
     base = 10 + int(cr * 0.35)  # mild scaling
-    role_bias = {
-        "Brute":      {"Str": 3, "Con": 3, "Dex": -1, "Int": -1},
-        "Skirmisher": {"Dex": 3, "Str": 1, "Con": 1, "Wis": 1},
-        "Artillery":  {"Dex": 2, "Int": 3, "Wis": 1, "Con": -1},
-        "Controller": {"Wis": 3, "Int": 2, "Dex": 1, "Str": -1},
-        "Support":    {"Wis": 3, "Cha": 2, "Con": 1, "Str": -1},
-        "Solo":       {"Con": 3, "Str": 2, "Dex": 1, "Wis": 1},
-    }.get(role, {})
+    role_bias = _ROLE_STAT_BIAS.get(role, {})
 
-    stats = {k: base for k in ["Str", "Dex", "Con", "Int", "Wis", "Cha"]}
+    stats = {k: base for k in _STAT_KEYS}
 
     for k, delta in role_bias.items():
         stats[k] += delta
@@ -151,27 +271,27 @@ def ability_scores_for_role(rng, cr: float, role: str) -> Dict[str, int]:
     cap = 20 if cr <= 10 else 24 if cr <= 20 else 26
     floor = 6 if cr <= 1 else 8
 
-    for k in stats:
-        stats[k] += rng.randint(-2, 2)
-        stats[k] = clamp(stats[k], floor, cap)
+    randint = rng.randint  # bound once; this is the draw-heaviest helper
+    for k in _STAT_KEYS:
+        stats[k] = clamp(stats[k] + randint(-2, 2), floor, cap)
 
     # Make sure the "primary" stats feel primary.
+    primaries = _ROLE_PRIMARIES.get(role, _STAT_KEYS)
     for _ in range(2):
-        k = choose(rng, list(role_bias.keys())) if role_bias else choose(rng, list(stats.keys()))
-        stats[k] = clamp(stats[k] + rng.randint(1, 3), floor, cap)
+        k = choose(rng, primaries)
+        stats[k] = clamp(stats[k] + randint(1, 3), floor, cap)
 
     return stats
 
 def suggested_speed(rng, creature_type: str, role: str) -> str:
     base = 30
-    if creature_type in ("Beast", "Fey"):
-        base = 40 if chance(rng, 0.35) else 30
-    if creature_type in ("Construct", "Ooze"):
-        base = 20 if chance(rng, 0.6) else 30
-    if creature_type in ("Dragon", "Fiend", "Celestial"):
-        base = 40 if chance(rng, 0.4) else 30
-
-    spd_mod = ROLE_MODS.get(role, {}).get("spd_mod", 0)
+    alt = _SPEED_BASE.get(creature_type)
+    if alt is not None:
+        alt_base, p = alt
+        base = alt_base if chance(rng, p) else 30
+
+    rm = ROLE_MODS.get(role)
+    spd_mod = rm.spd_mod if rm is not None else 0
     walk = clamp(base + spd_mod, 10, 60)
 
     modes = []
@@ -189,38 +309,35 @@ def suggested_speed(rng, creature_type: str, role: str) -> str:
     return f"{walk} ft."
 
 def hit_dice_for_size(size: str) -> int:
-    return {
-        "Tiny": 4, "Small": 6, "Medium": 8, "Large": 10, "Huge": 12, "Gargantuan": 20
-    }.get(size, 8)
+    return _HIT_DIE_BY_SIZE.get(size, 8)
 
 def compute_hp_and_ac(rng, target_cr: float, role: str) -> Tuple[int, int]:
     # Start from CR band center and apply role mods
     # Find closest CR band row to target_cr
-    row = min(CR_BANDS, key=lambda r: abs(r[0] - target_cr))
+    row = _band_for_cr(target_cr)
     cr, hp_min, hp_max, base_ac, dpr_min, dpr_max, atk, dc = row
+    rm = ROLE_MODS[role]
     hp_center = int((hp_min + hp_max) / 2)
-    hp = int(hp_center * ROLE_MODS[role]["hp_mult"])
+    hp = int(hp_center * rm.hp_mult)
     hp = int(hp * rng.uniform(0.90, 1.10))
     hp = max(1, hp)
 
-    ac = base_ac + ROLE_MODS[role]["ac_mod"] + rng.randint(-1, 1)
+    ac = base_ac + rm.ac_mod + rng.randint(-1, 1)
     ac = clamp(ac, 10, 22)
     return hp, ac
 
 def compute_target_dpr(rng, target_cr: float, role: str) -> float:
-    row = min(CR_BANDS, key=lambda r: abs(r[0] - target_cr))
+    row = _band_for_cr(target_cr)
     dpr = (row[4] + row[5]) / 2.0
-    dpr *= ROLE_MODS[role]["dpr_mult"]
+    dpr *= ROLE_MODS[role].dpr_mult
     dpr *= rng.uniform(0.90, 1.10)
     return max(0.0, dpr)
 
 def expected_attack_bonus(target_cr: float) -> int:
-    row = min(CR_BANDS, key=lambda r: abs(r[0] - target_cr))
-    return row[6]
+    return _band_for_cr(target_cr)[6]
 
 def expected_save_dc(target_cr: float) -> int:
-    row = min(CR_BANDS, key=lambda r: abs(r[0] - target_cr))
-    return row[7]
+    return _band_for_cr(target_cr)[7]
 
 def pick_saves_and_skills(rng, stats: Dict[str, int], prof: int, creature_type: str, role: str):
     # Choose 1-3 saves and 2-4 skills.
@@ -229,15 +346,7 @@ def pick_saves_and_skills(rng, stats: Dict[str, int], prof: int, creature_type:
         save_count = 3
 
     # Bias saves by type
-    save_bias = {
-        "Undead": ["Wis", "Con"],
-        "Dragon": ["Dex", "Con", "Wis"],
-        "Fiend": ["Wis", "Cha"],
-        "Fey": ["Dex", "Wis"],
-        "Construct": ["Con", "Wis"],
-        "Beast": ["Dex", "Con"],
-        "Humanoid": ["Dex", "Wis"],
-    }.get(creature_type, ["Dex", "Con"])
+    save_bias = _SAVE_BIAS_BY_TYPE.get(creature_type, ("Dex", "Con"))
 
     saves = {}
     for _ in range(save_count):
@@ -247,32 +356,10 @@ def pick_saves_and_skills(rng, stats: Dict[str, int], prof: int, creature_type:
 
     # Skills
     skill_count = 2 + (1 if chance(rng, 0.35) else 0) + (1 if role == "Solo" else 0)
-    # Rough mapping of skills to abilities
-    skill_ability = {
-        "Athletics": "Str",
-        "Acrobatics": "Dex",
-        "Sleight of Hand": "Dex",
-        "Stealth": "Dex",
-        "Arcana": "Int",
-        "History": "Int",
-        "Investigation": "Int",
-        "Nature": "Int",
-        "Religion": "Int",
-        "Animal Handling": "Wis",
-        "Insight": "Wis",
-        "Medicine": "Wis",
-        "Perception": "Wis",
-        "Survival": "Wis",
-        "Deception": "Cha",
-        "Intimidation": "Cha",
-        "Performance": "Cha",
-        "Persuasion": "Cha",
-    }
-
     skills = {}
     for _ in range(skill_count):
         sk = choose(rng, SKILLS)
-        abil = skill_ability[sk]
+        abil = _SKILL_ABILITY[sk]
         mod = (stats[abil] - 10) // 2
         # Some monsters have expertise-ish bumps; keep modest
         bump = prof if chance(rng, 0.15) else 0
@@ -300,9 +387,10 @@ def senses_and_languages(rng, creature_type: str, stats: Dict[str, int]) -> Tupl
     if creature_type in ("Beast", "Ooze", "Plant"):
         langs = "—"
     else:
-        options = ["Common", "Dwarvish", "Elvish", "Goblin", "Infernal", "Abyssal", "Draconic", "Celestial", "Sylvan", "Undercommon"]
         count = 1 + (1 if chance(rng, 0.35) else 0)
-        langs = ", ".join(sorted(set(choose(rng, options) for _ in range(count))))
+        picked = rng.sample(_LANGUAGES, count)  # distinct picks in one call
+        picked.sort()
+        langs = ", ".join(picked)
         if chance(rng, 0.2):
             langs += "; telepathy 60 ft."
     return senses, langs
@@ -322,16 +410,16 @@ def choose_defenses(rng, creature_type: str, cr: float) -> Tuple[str, str, str,
         if chance(rng, 0.5): resist.append("fire")
         if chance(rng, 0.25): resist.append("cold")
     elif creature_type == "Elemental":
-        if chance(rng, 0.5): immune.append(choose(rng, ["poison", "fire", "cold", "lightning"]))
+        if chance(rng, 0.5): immune.append(choose(rng, _ELEMENTAL_IMMUNE))
         if chance(rng, 0.25): cond_immune.append("poisoned")
     elif creature_type == "Construct":
         if chance(rng, 0.5): immune.append("poison")
-        if chance(rng, 0.6): cond_immune += ["poisoned", "charmed", "exhaustion"]
+        if chance(rng, 0.6): cond_immune += _CONSTRUCT_COND_IMMUNE
     elif creature_type == "Ooze":
         if chance(rng, 0.4): immune.append("acid")
-        if chance(rng, 0.6): cond_immune += ["blinded", "charmed", "deafened", "frightened", "prone"]
+        if chance(rng, 0.6): cond_immune += _OOZE_COND_IMMUNE
     elif creature_type == "Dragon":
-        if chance(rng, 0.85): immune.append(choose(rng, ["fire", "cold", "lightning", "poison", "acid"]))
+        if chance(rng, 0.85): immune.append(choose(rng, _DRAGON_IMMUNE))
 
     # CR gate: avoid heavy immunity stacks at low CR
     if cr <= 2:
@@ -349,12 +437,12 @@ def choose_defenses(rng, creature_type: str, cr: float) -> Tuple[str, str, str,
         ", ".join(vuln),
     )
 
-def make_attack_suite(rng, target_cr: float, role: str, stats: Dict[str, int], prof: int) -> Tuple[List[MonsterAttack], float, int, int]:
+def make_attack_suite(rng, target_cr: float, role: str, stats: Dict[str, int], prof: int) -> Tuple[List[MonsterAttack], float, int, int, int]:
     """
-    Returns: attacks, dpr_estimate, attack_bonus, save_dc
+    Returns: attacks, dpr_estimate, attack_bonus, save_dc, swings
     """
     dpr_target = compute_target_dpr(rng, target_cr, role)
-    exp_atk = expected_attack_bonus(target_cr) + ROLE_MODS[role]["atk_mod"]
+    exp_atk = expected_attack_bonus(target_cr) + ROLE_MODS[role].atk_mod
     save_dc = expected_save_dc(target_cr)
 
     # Choose whether this monster attacks via weapon attacks or forced saves (controller)
@@ -372,12 +460,12 @@ def make_attack_suite(rng, target_cr: float, role: str, stats: Dict[str, int], p
 
     # Build 1-2 attacks, plus multiattack text as an action.
     attacks: List[MonsterAttack] = []
-    damage_type = choose(rng, ["slashing", "piercing", "bludgeoning"] + DAMAGE_TYPES)
+    damage_type = choose(rng, _WEAPON_DAMAGE_TYPES)
     if prefers_save:
         # "Spell-like" action with a save rider contributes to DPR
         # We'll represent as an "Action" rather than "Attack" in statblock.
         # But we still return DPR estimate.
-        return attacks, dpr_target, to_hit, save_dc
+        return attacks, dpr_target, to_hit, save_dc, 1
 
     # Determine number of swings
     swings = 1
@@ -410,7 +498,7 @@ def make_attack_suite(rng, target_cr: float, role: str, stats: Dict[str, int], p
     # Small tweak: add +2 or +3 flat if still low at higher CR
     flat = 0
     if achieved < per_swing * 0.9 and target_cr >= 5:
-        flat = rng.choice([2, 3])
+        flat = rng.choice(_FLAT_BONUS)
 
     dmg_expr = f"{n}d{die} {fmt_signed(max(0, mod) + flat)}"
     dmg_str = f"{dmg_expr} {damage_type} damage"
@@ -420,7 +508,7 @@ def make_attack_suite(rng, target_cr: float, role: str, stats: Dict[str, int], p
         reach = "10 ft."
 
     attacks.append(MonsterAttack(
-        name=choose(rng, ["Claw", "Bite", "Slam", "Glaive", "Scything Talon", "Warped Strike"]),
+        name=choose(rng, _ATTACK_NAMES_MELEE),
         kind="Melee Weapon Attack",
         to_hit=to_hit,
         reach_or_range=f"reach {reach}",
@@ -439,7 +527,7 @@ def make_attack_suite(rng, target_cr: float, role: str, stats: Dict[str, int], p
         r_expr = f"{r_n}d{r_die} {fmt_signed(max(0, mod))}"
         r_dmg = f"{r_expr} {choose(rng, DAMAGE_TYPES)} damage"
         attacks.append(MonsterAttack(
-            name=choose(rng, ["Shard Bolt", "Barbed Javelin", "Spine Volley", "Void Needle"]),
+            name=choose(rng, _ATTACK_NAMES_RANGED),
             kind="Ranged Weapon Attack",
             to_hit=to_hit,
             reach_or_range="range 60/180 ft.",
@@ -449,32 +537,24 @@ def make_attack_suite(rng, target_cr: float, role: str, stats: Dict[str, int], p
         ))
 
     # DPR estimate: just target (we tuned around it)
-    return attacks, dpr_target, to_hit, save_dc
+    return attacks, dpr_target, to_hit, save_dc, swings
 
-def build_actions_from_attacks(rng, attacks: List[MonsterAttack], target_cr: float, role: str, save_dc: int, dpr_target: float) -> List[MonsterAbility]:
+def build_actions_from_attacks(rng, attacks: List[MonsterAttack], target_cr: float, role: str, save_dc: int, dpr_target: float, swings: int = 1) -> List[MonsterAbility]:
     actions: List[MonsterAbility] = []
 
     if attacks:
-        # Make Multiattack if more than 1 swing implied at higher CR
-        swings = 1
-        if target_cr >= 5 and chance(rng, 0.7):
-            swings = 2
-        if target_cr >= 11 and chance(rng, 0.5):
-            swings = max(swings, 3)
-
+        # Make Multiattack when the attack suite split DPR across several swings
         if swings >= 2:
-            names = []
-            # Prefer first attack name repeated
-            names.append(attacks[0].name)
-            if len(attacks) > 1 and chance(rng, 0.35):
-                names.append(attacks[1].name)
-            # Build a simple multiattack statement
-            if len(names) == 1:
-                text = f"The monster makes {swings} {names[0].lower()} attacks."
+            # Prefer first attack name repeated; sometimes mix in the second attack
+            n0 = attacks[0].name_lower
+            n1 = attacks[1].name_lower if len(attacks) > 1 and chance(rng, 0.35) else None
+            tmpl = _MULTIATTACK_TEMPLATES.get((swings, n1 is not None))
+            if tmpl is not None:
+                text = tmpl.format(n0=n0, n1=n1)
+            elif n1 is None:
+                text = f"The monster makes {swings} {n0} attacks."
             else:
-                # e.g., two claw attacks and one bolt
-                parts = [f"{max(1, swings-1)} {names[0].lower()} attack{'s' if swings-1 != 1 else ''}", f"one {names[1].lower()} attack"]
-                text = "The monster makes " + " and ".join(parts) + "."
+                text = f"The monster makes {swings - 1} {n0} attacks and one {n1} attack."
             actions.append(MonsterAbility(name="Multiattack", text=text, category="Action"))
 
         # Add each attack as an action line
@@ -503,7 +583,7 @@ def build_actions_from_attacks(rng, attacks: List[MonsterAttack], target_cr: flo
             f"On a failed save, the target takes {dmg_expr} {dmg_type} damage, and it must also {effect_text} "
             f"On a successful save, the target takes half as much damage and suffers no additional effect."
         )
-        actions.append(MonsterAbility(name=choose(rng, ["Warp Hex", "Binding Pulse", "Mind-Splinter", "Grasping Surge"]), text=text, category="Action"))
+        actions.append(MonsterAbility(name=choose(rng, _CONTROL_ACTION_NAMES), text=text, category="Action"))
 
     # Recharge breath/beam for dragons/solos at higher CR (optional)
     if role in ("Solo",) and target_cr >= 8 and chance(rng, 0.5):
@@ -528,63 +608,74 @@ def maybe_add_traits(rng, creature_type: str, role: str, cr: float) -> Tuple[Lis
     count = 1 + (1 if chance(rng, 0.5) else 0) + (1 if role == "Solo" else 0)
 
     # Ensure thematic picks
-    pool = list(TRAIT_LIBRARY)
     if creature_type in ("Fiend", "Fey", "Undead", "Dragon") and chance(rng, 0.4):
-        traits.append(MonsterAbility(name="Innate Magic", text="The monster’s attacks are magical for the purpose of overcoming resistance and immunity to nonmagical attacks.", category="Trait"))
+        traits.append(_INNATE_MAGIC)
 
     for _ in range(count):
-        t = choose(rng, pool)
-        traits.append(MonsterAbility(name=t["name"], text=t["text"], category="Trait"))
+        traits.append(choose(rng, _TRAIT_ABILITIES))
 
     # Reactions are rarer at low CR
     if cr >= 3 and chance(rng, 0.35):
-        r = choose(rng, REACTION_LIBRARY)
-        reactions.append(MonsterAbility(name=r["name"], text=r["text"], category="Reaction"))
+        reactions.append(choose(rng, _REACTION_ABILITIES))
 
     # Condition immunities sometimes deserve a trait explanation
     return traits, reactions
 
-def estimate_defensive_cr(hp: int, ac: int) -> Tuple[float, str]:
+def _defensive_cr_numeric(hp: int, ac: int) -> Tuple[float, int, tuple]:
+    # Pure arithmetic part of the defensive audit: (adjusted CR, AC shift, HP band row).
     band = band_for_hp(hp)
-    base_cr = float(band[0])
-    expected_ac = band[3]
     # DMG-style: every 2 AC above/below shifts CR by 1 (approx)
-    delta = ac - expected_ac
-    shift = int(math.floor(delta / 2))
-    adj_cr = clamp(base_cr + shift, 0, 30)
-    note = f"HP {hp} ⇒ base DCR {cr_label(base_cr)} (band {band[1]}–{band[2]}), AC {ac} vs expected {expected_ac} ⇒ shift {shift:+d}"
-    return float(adj_cr), note
+    shift = (ac - band[3]) // 2
+    return float(clamp(float(band[0]) + shift, 0, 30)), shift, band
 
-def estimate_offensive_cr(dpr: float, attack_bonus: int, save_dc: int, uses_save: bool) -> Tuple[float, str]:
+def _offensive_cr_numeric(dpr: float, attack_bonus: int, save_dc: int, uses_save: bool) -> Tuple[float, int, tuple]:
+    # Pure arithmetic part of the offensive audit: (adjusted CR, shift, DPR band row).
     band = band_for_dpr(dpr)
-    base_cr = float(band[0])
-    expected_atk = band[6]
-    expected_dc = band[7]
-    if uses_save:
-        delta = save_dc - expected_dc
-    else:
-        delta = attack_bonus - expected_atk
-    shift = int(math.floor(delta / 2))  # every 2 points ~ 1 CR shift
-    adj_cr = clamp(base_cr + shift, 0, 30)
-    which = f"DC {save_dc} vs {expected_dc}" if uses_save else f"+{attack_bonus} vs +{expected_atk}"
-    note = f"DPR {dpr:.1f} ⇒ base OCR {cr_label(base_cr)} (band {band[4]}–{band[5]}), {which} ⇒ shift {shift:+d}"
-    return float(adj_cr), note
+    delta = save_dc - band[7] if uses_save else attack_bonus - band[6]
+    shift = delta // 2  # every 2 points ~ 1 CR shift
+    return float(clamp(float(band[0]) + shift, 0, 30)), shift, band
+
+def estimate_defensive_cr(hp: int, ac: int) -> Tuple[float, str]:
+    adj_cr, shift, band = _defensive_cr_numeric(hp, ac)
+    note = f"HP {hp} ⇒ base DCR {cr_label(float(band[0]))} (band {band[1]}–{band[2]}), AC {ac} vs expected {band[3]} ⇒ shift {shift:+d}"
+    return adj_cr, note
+
+def estimate_offensive_cr(dpr: float, attack_bonus: int, save_dc: int, uses_save: bool) -> Tuple[float, str]:
+    adj_cr, shift, band = _offensive_cr_numeric(dpr, attack_bonus, save_dc, uses_save)
+    which = f"DC {save_dc} vs {band[7]}" if uses_save else f"+{attack_bonus} vs +{band[6]}"
+    note = f"DPR {dpr:.1f} ⇒ base OCR {cr_label(float(band[0]))} (band {band[4]}–{band[5]}), {which} ⇒ shift {shift:+d}"
+    return adj_cr, note
 
 def finalize_cr(dcr: float, ocr: float) -> float:
     return float(clamp((dcr + ocr) / 2.0, 0, 30))
 
 def random_name(rng, creature_type: str, role: str) -> str:
-    adj = ["Ashen", "Gutter", "Gleaming", "Wretched", "Umbral", "Verdant", "Howling", "Sable", "Ivory", "Rime", "Scorch", "Grim"]
-    nouns = ["Stalker", "Husk", "Marauder", "Seer", "Behemoth", "Warden", "Reaver", "Sentinel", "Mireling", "Skirmisher", "Oracle", "Devourer"]
     type_tag = creature_type.lower()
-    core = f"{choose(rng, adj)} {choose(rng, nouns)}"
+    core = f"{choose(rng, _ADJ)} {choose(rng, _NOUNS)}"
     if chance(rng, 0.35):
-        core = f"{core} of the {choose(rng, ['Deep', 'Hollow', 'Iron', 'Thorn', 'Wyrd', 'Cinder'])}"
+        core = f"{core} of the {choose(rng, _EPITHETS)}"
     if chance(rng, 0.25):
         core = f"{core} ({type_tag})"
     return core
 
-def generate_monster(rng, target_cr: float, role: str, creature_type: str, size: str, alignment: str, name: Optional[str] = None) -> Monster:
+def random_names_batch(rng, n: int, creature_type: str) -> List[str]:
+    """
+    Draw n names in one pass: each name component is a single rng.choices() column.
+    Same distribution as random_name(), but not the same sequence for a given seed.
+    """
+    tag = f" ({creature_type.lower()})"
+    adjs = rng.choices(_ADJ, k=n)
+    nouns = rng.choices(_NOUNS, k=n)
+    epithets = rng.choices(_EPITHETS, k=n)
+    # cum_weights=(p, 1.0) yields True with probability p, like chance()
+    with_epithet = rng.choices(_TRUE_FALSE, cum_weights=(0.35, 1.0), k=n)
+    with_tag = rng.choices(_TRUE_FALSE, cum_weights=(0.25, 1.0), k=n)
+    return [
+        f"{a} {b}" + (f" of the {e}" if ep else "") + (tag if tg else "")
+        for a, b, e, ep, tg in zip(adjs, nouns, epithets, with_epithet, with_tag)
+    ]
+
+def generate_monster(rng, target_cr: float, role: str, creature_type: str, size: str, alignment: str, name: Optional[str] = None, with_audit: bool = True) -> Monster:
     prof = proficiency_for_cr(target_cr)
 
     stats = ability_scores_for_role(rng, target_cr, role)
@@ -604,16 +695,36 @@ def generate_monster(rng, target_cr: float, role: str, creature_type: str, size:
 
     resist, immune, cond_immune, vuln = choose_defenses(rng, creature_type, target_cr)
 
-    attacks, dpr_est, atk_bonus, save_dc = make_attack_suite(rng, target_cr, role, stats, prof)
+    attacks, dpr_est, atk_bonus, save_dc, swings = make_attack_suite(rng, target_cr, role, stats, prof)
     uses_save = (len(attacks) == 0)
-    actions = build_actions_from_attacks(rng, attacks, target_cr, role, save_dc, dpr_est)
+    actions = build_actions_from_attacks(rng, attacks, target_cr, role, save_dc, dpr_est, swings)
 
     traits, reactions = maybe_add_traits(rng, creature_type, role, target_cr)
 
-    # CR audit
-    dcr, dcr_note = estimate_defensive_cr(hp, ac)
-    ocr, ocr_note = estimate_offensive_cr(dpr_est, atk_bonus, save_dc, uses_save)
+    # CR audit (the GM-facing notes are only formatted when the audit is kept)
+    if with_audit:
+        dcr, dcr_note = estimate_defensive_cr(hp, ac)
+        ocr, ocr_note = estimate_offensive_cr(dpr_est, atk_bonus, save_dc, uses_save)
+    else:
+        dcr = _defensive_cr_numeric(hp, ac)[0]
+        ocr = _offensive_cr_numeric(dpr_est, atk_bonus, save_dc, uses_save)[0]
     final = finalize_cr(dcr, ocr)
+    cr = cr_label(final)
+
+    audit: Dict[str, str] = {}
+    if with_audit:
+        audit = {
+            "target_cr": cr_label(target_cr),
+            "defensive_cr": cr_label(dcr),
+            "offensive_cr": cr_label(ocr),
+            "final_cr": cr,
+            "dcr_note": dcr_note,
+            "ocr_note": ocr_note,
+            "uses_save": "yes" if uses_save else "no",
+            "dpr_est": f"{dpr_est:.1f}",
+            "attack_bonus": str(atk_bonus),
+            "save_dc": str(save_dc),
+        }
 
     mon = Monster(
         name=name or random_name(rng, creature_type, role),
@@ -629,7 +740,7 @@ def generate_monster(rng, target_cr: float, role: str, creature_type: str, size:
         skills=skills,
         senses=senses,
         languages=languages,
-        cr=cr_label(final),
+        cr=cr,
         xp=xp_for_cr(final),
         proficiency_bonus=proficiency_for_cr(final),
         damage_resistances=resist,
@@ -640,18 +751,7 @@ def generate_monster(rng, target_cr: float, role: str, creature_type: str, size:
         actions=actions,
         reactions=reactions,
         legendary_actions=[],
-        audit={
-            "target_cr": cr_label(target_cr),
-            "defensive_cr": cr_label(dcr),
-            "offensive_cr": cr_label(ocr),
-            "final_cr": cr_label(final),
-            "dcr_note": dcr_note,
-            "ocr_note": ocr_note,
-            "uses_save": "yes" if uses_save else "no",
-            "dpr_est": f"{dpr_est:.1f}",
-            "attack_bonus": str(atk_bonus),
-            "save_dc": str(save_dc),
-        },
+        audit=audit,
     )
 
     # Add legendary actions for Solo at higher CR
@@ -669,79 +769,115 @@ def generate_monster(rng, target_cr: float, role: str, creature_type: str, size:
 
     return mon
 
+def _broadcast(value, n: int) -> Sequence:
+    # A lone string applies to every monster in the batch.
+    if isinstance(value, str):
+        return (value,) * n
+    if len(value) != n:
+        raise ValueError(f"expected {n} values, got {len(value)}")
+    return value
+
+def generate_monsters_batch(
+    rng,
+    target_crs: Sequence[float],
+    roles: Union[str, Sequence[str]],
+    creature_types: Union[str, Sequence[str]],
+    sizes: Union[str, Sequence[str]],
+    alignments: Union[str, Sequence[str]],
+    with_audit: bool = True,
+) -> List[Monster]:
+    """
+    Generate one monster per entry in target_crs, drawing from rng in order.
+    The other columns are either one shared value or a sequence aligned with target_crs.
+    The result is identical to calling generate_monster() in a loop with the same rng.
+    """
+    n = len(target_crs)
+    cols = [_broadcast(c, n) for c in (roles, creature_types, sizes, alignments)]
+    gen = generate_monster
+    return [
+        gen(rng, cr, role, ctype, size, align, with_audit=with_audit)
+        for cr, role, ctype, size, align in zip(target_crs, *cols)
+    ]
+
+_STATBLOCK_HEADER = (
+    "## {name}\n"
+    "*{size} {ctype}, {align}*\n"
+    "\n"
+    "**Armor Class** {ac}\n"
+    "**Hit Points** {hp} ({hit_dice})\n"
+    "**Speed** {speed}\n"
+    "\n"
+    "|STR|DEX|CON|INT|WIS|CHA|\n"
+    "|---:|---:|---:|---:|---:|---:|\n"
+    "|{cells}|\n"
+).format
+
+# (label, Monster attribute) for the optional one-line defensive/sensory entries, in statblock order.
+_STATBLOCK_OPTIONAL = (
+    ("**Damage Vulnerabilities** ", "vulnerabilities"),
+    ("**Damage Resistances** ", "damage_resistances"),
+    ("**Damage Immunities** ", "damage_immunities"),
+    ("**Condition Immunities** ", "condition_immunities"),
+    ("**Senses** ", "senses"),
+    ("**Languages** ", "languages"),
+)
+
+def _ability_section(title: str, abilities: List[MonsterAbility]) -> str:
+    body = "\n".join(f"**{a.name}.** {a.text}" for a in abilities)
+    return f"### {title}\n{body}\n"
+
 def monster_to_markdown(mon: Monster) -> str:
+    return monster_to_markdown_with_audit_offset(mon)[0]
+
+def monster_to_markdown_with_audit_offset(mon: Monster) -> Tuple[str, int]:
+    """
+    Render the statblock and return (markdown, offset), where markdown[offset:] is the
+    CR audit panel (starting with its "\n---\n" separator).
+    """
     # 5e style markdown block. Compatible with scratchpad + export.
     # This is “statblock-like” without relying on proprietary formatting.
-    lines = []
-    lines.append(f"## {mon.name}")
-    lines.append(f"*{mon.size} {mon.creature_type.lower()}, {mon.alignment}*")
-    lines.append("")
-    lines.append(f"**Armor Class** {mon.ac}")
-    lines.append(f"**Hit Points** {mon.hp} ({mon.hit_dice})")
-    lines.append(f"**Speed** {mon.speed}")
-    lines.append("")
-    lines.append("|STR|DEX|CON|INT|WIS|CHA|")
-    lines.append("|---:|---:|---:|---:|---:|---:|")
+    # Each entry below is a whole chunk of the statblock; chunks are joined with newlines.
     s = mon.stats
-    def cell(k):
-        m = (s[k]-10)//2
-        return f"{s[k]} ({fmt_signed(m)})"
-    lines.append(f"|{cell('Str')}|{cell('Dex')}|{cell('Con')}|{cell('Int')}|{cell('Wis')}|{cell('Cha')}|")
-    lines.append("")
+    cells = "|".join(f"{s[k]} ({fmt_signed((s[k] - 10) // 2)})" for k in _STAT_KEYS)
+    lines = [_STATBLOCK_HEADER(
+        name=mon.name, size=mon.size, ctype=mon.creature_type.lower(), align=mon.alignment,
+        ac=mon.ac, hp=mon.hp, hit_dice=mon.hit_dice, speed=mon.speed, cells=cells,
+    )]
 
     if mon.saves:
         lines.append("**Saving Throws** " + ", ".join(f"{k} {fmt_signed(v)}" for k, v in mon.saves.items()))
     if mon.skills:
         lines.append("**Skills** " + ", ".join(f"{k} {fmt_signed(v)}" for k, v in mon.skills.items()))
-    if mon.vulnerabilities:
-        lines.append("**Damage Vulnerabilities** " + mon.vulnerabilities)
-    if mon.damage_resistances:
-        lines.append("**Damage Resistances** " + mon.damage_resistances)
-    if mon.damage_immunities:
-        lines.append("**Damage Immunities** " + mon.damage_immunities)
-    if mon.condition_immunities:
-        lines.append("**Condition Immunities** " + mon.condition_immunities)
-    if mon.senses:
-        lines.append("**Senses** " + mon.senses)
-    if mon.languages:
-        lines.append("**Languages** " + mon.languages)
-    lines.append(f"**Challenge** {mon.cr} ({mon.xp} XP)  **Proficiency Bonus** {fmt_signed(mon.proficiency_bonus)}")
-    lines.append("")
+    for label, attr in _STATBLOCK_OPTIONAL:
+        value = getattr(mon, attr)
+        if value:
+            lines.append(label + value)
+    lines.append(f"**Challenge** {mon.cr} ({mon.xp} XP)  **Proficiency Bonus** {fmt_signed(mon.proficiency_bonus)}\n")
 
     if mon.traits:
-        lines.append("### Traits")
-        for t in mon.traits:
-            lines.append(f"**{t.name}.** {t.text}")
-        lines.append("")
-
+        lines.append(_ability_section("Traits", mon.traits))
     if mon.actions:
-        lines.append("### Actions")
-        for a in mon.actions:
-            lines.append(f"**{a.name}.** {a.text}")
-        lines.append("")
-
+        lines.append(_ability_section("Actions", mon.actions))
     if mon.reactions:
-        lines.append("### Reactions")
-        for r in mon.reactions:
-            lines.append(f"**{r.name}.** {r.text}")
-        lines.append("")
-
+        lines.append(_ability_section("Reactions", mon.reactions))
     if mon.legendary_actions:
-        lines.append("### Legendary Actions")
-        for la in mon.legendary_actions:
-            if la.category == "Legendary Header":
-                lines.append(la.text)
-            else:
-                lines.append(f"**{la.name}.** {la.text}")
-        lines.append("")
+        body = "\n".join(
+            la.text if la.category == "Legendary Header" else f"**{la.name}.** {la.text}"
+            for la in mon.legendary_actions
+        )
+        lines.append(f"### Legendary Actions\n{body}\n")
 
     # CR audit panel at bottom (GM-facing, optional)
-    lines.append("---")
-    lines.append("### CR Audit (Generator)")
-    lines.append(f"- Target CR: **{mon.audit.get('target_cr','?')}**")
-    lines.append(f"- Defensive CR: **{mon.audit.get('defensive_cr','?')}** — {mon.audit.get('dcr_note','')}")
-    lines.append(f"- Offensive CR: **{mon.audit.get('offensive_cr','?')}** — {mon.audit.get('ocr_note','')}")
-    lines.append(f"- Final CR: **{mon.audit.get('final_cr','?')}**")
-    lines.append(f"- DPR estimate: **{mon.audit.get('dpr_est','?')}**, Uses save-based offense: **{mon.audit.get('uses_save','?')}**, Attack bonus: **+{mon.audit.get('attack_bonus','?')}**, Save DC: **{mon.audit.get('save_dc','?')}**")
-
-    return "\n".join(lines)
+    a = mon.audit.get
+    lines.append(
+        "---\n"
+        "### CR Audit (Generator)\n"
+        f"- Target CR: **{a('target_cr','?')}**\n"
+        f"- Defensive CR: **{a('defensive_cr','?')}** — {a('dcr_note','')}\n"
+        f"- Offensive CR: **{a('offensive_cr','?')}** — {a('ocr_note','')}\n"
+        f"- Final CR: **{a('final_cr','?')}**\n"
+        f"- DPR estimate: **{a('dpr_est','?')}**, Uses save-based offense: **{a('uses_save','?')}**, Attack bonus: **+{a('attack_bonus','?')}**, Save DC: **{a('save_dc','?')}**"
+    )
+
+    md = "\n".join(lines)
+    return md, len(md) - len(lines[-1]) - 1
@@ -2,23 +2,31 @@
 
 from __future__ import annotations
 
+import math
+from bisect import bisect_right
+from dataclasses import dataclass
+
 # ---- Utility tables for 5e-ish generation ----
+# Tuples: these feed combo boxes and random picks and are never mutated.
 
-CREATURE_TYPES = [
+CREATURE_TYPES = (
     "Aberration", "Beast", "Celestial", "Construct", "Dragon", "Elemental", "Fey",
     "Fiend", "Giant", "Humanoid", "Monstrosity", "Ooze", "Plant", "Undead",
-]
+)
 
-SIZES = ["Tiny", "Small", "Medium", "Large", "Huge", "Gargantuan"]
+SIZES = ("Tiny", "Small", "Medium", "Large", "Huge", "Gargantuan")
 
-ALIGNMENTS = [
+ALIGNMENTS = (
     "lawful good", "neutral good", "chaotic good",
     "lawful neutral", "neutral", "chaotic neutral",
     "lawful evil", "neutral evil", "chaotic evil",
     "unaligned",
-]
+)
 
-ROLES = ["Brute", "Skirmisher", "Artillery", "Controller", "Support", "Solo"]
+ROLES = ("Brute", "Skirmisher", "Artillery", "Controller", "Support", "Solo")
+
+# Target CR labels in the order the UI offers them.
+CR_CHOICES = ("0", "1/8", "1/4", "1/2", *map(str, range(1, 31)))
 
 DAMAGE_TYPES = [
     "bludgeoning", "piercing", "slashing",
@@ -43,23 +51,16 @@ SAVES = ["Str", "Dex", "Con", "Int", "Wis", "Cha"]
 
 # ---- 5e proficiency by CR (SRD-consistent style) ----
 # CR can be fractional; proficiency depends on CR "band".
+# 5e: +2 up to CR 4, +3 CR 5-8, +4 CR 9-12, +5 CR 13-16, +6 CR 17-20, +7 21-24, +8 25-28, +9 29-30
+_PROF_TABLE = tuple(
+    2 if c <= 4 else 3 if c <= 8 else 4 if c <= 12 else 5 if c <= 16
+    else 6 if c <= 20 else 7 if c <= 24 else 8 if c <= 28 else 9
+    for c in range(31)
+)
+
 def proficiency_for_cr(cr: float) -> int:
-    # 5e: +2 up to CR 4, +3 CR 5-8, +4 CR 9-12, +5 CR 13-16, +6 CR 17-20, +7 21-24, +8 25-28, +9 29-30
-    if cr <= 4:
-        return 2
-    if cr <= 8:
-        return 3
-    if cr <= 12:
-        return 4
-    if cr <= 16:
-        return 5
-    if cr <= 20:
-        return 6
-    if cr <= 24:
-        return 7
-    if cr <= 28:
-        return 8
-    return 9
+    # Round up so fractional CRs (1/8, or averaged audit CRs like 4.5) land in the right band.
+    return _PROF_TABLE[min(30, max(0, math.ceil(cr)))]
 
 # ---- DMG-style CR tables (simplified but faithful enough for generator balancing) ----
 # These are *approximate* bands that match typical DMG guidance:
@@ -106,34 +107,59 @@ CR_BANDS = [
 ]
 
 # Quick lookup helpers
+# Bands are ascending and back-to-back, so the row for a value is the last one whose
+# minimum is <= value. Values below the first band clamp to it; above the last, to the last.
+# Column view of CR_BANDS (one tuple per field) for the lookups and bulk callers.
+(BAND_CRS, _HP_MINS, _HP_MAXS, _BAND_ACS,
+ _DPR_MINS, _DPR_MAXS, _BAND_ATKS, _BAND_DCS) = map(tuple, zip(*CR_BANDS))
+
+def band_index_for_hp(hp: int) -> int:
+    # Row index into CR_BANDS (and each column tuple) for an HP value.
+    return max(0, bisect_right(_HP_MINS, hp) - 1)
+
+def band_index_for_dpr(dpr: float) -> int:
+    # Row index into CR_BANDS (and each column tuple) for a DPR value.
+    return max(0, bisect_right(_DPR_MINS, dpr) - 1)
+
 def band_for_hp(hp: int):
-    for row in CR_BANDS:
-        cr, hp_min, hp_max, ac, dpr_min, dpr_max, atk, dc = row
-        if hp_min <= hp <= hp_max:
-            return row
-    if hp < CR_BANDS[0][1]:
-        return CR_BANDS[0]
-    return CR_BANDS[-1]
+    return CR_BANDS[band_index_for_hp(hp)]
 
 def band_for_dpr(dpr: float):
-    for row in CR_BANDS:
-        cr, hp_min, hp_max, ac, dpr_min, dpr_max, atk, dc = row
-        if dpr_min <= dpr <= dpr_max:
-            return row
-    if dpr < CR_BANDS[0][4]:
-        return CR_BANDS[0]
-    return CR_BANDS[-1]
+    return CR_BANDS[band_index_for_dpr(dpr)]
+
+def bands_for_hp(hps) -> list:
+    # Bulk form of band_for_hp for batch generation.
+    rows, idx = CR_BANDS, band_index_for_hp
+    return [rows[idx(hp)] for hp in hps]
+
+def bands_for_dpr(dprs) -> list:
+    # Bulk form of band_for_dpr for batch generation.
+    rows, idx = CR_BANDS, band_index_for_dpr
+    return [rows[idx(dpr)] for dpr in dprs]
 
 # ---- Archetype knobs ----
+@dataclass(frozen=True, slots=True)
+class RoleMod:
+    hp_mult: float
+    ac_mod: int
+    dpr_mult: float
+    atk_mod: int
+    spd_mod: int
+
 ROLE_MODS = {
-    "Brute":      {"hp_mult": 1.15, "ac_mod": -1, "dpr_mult": 1.15, "atk_mod": 0, "spd_mod": 0},
-    "Skirmisher": {"hp_mult": 0.95, "ac_mod":  1, "dpr_mult": 1.00, "atk_mod": 1, "spd_mod": 10},
-    "Artillery":  {"hp_mult": 0.85, "ac_mod":  0, "dpr_mult": 1.20, "atk_mod": 1, "spd_mod": 0},
-    "Controller": {"hp_mult": 1.00, "ac_mod":  0, "dpr_mult": 0.95, "atk_mod": 0, "spd_mod": 0},
-    "Support":    {"hp_mult": 0.95, "ac_mod":  0, "dpr_mult": 0.90, "atk_mod": 0, "spd_mod": 0},
-    "Solo":       {"hp_mult": 1.40, "ac_mod":  1, "dpr_mult": 1.25, "atk_mod": 1, "spd_mod": 0},
+    "Brute":      RoleMod(hp_mult=1.15, ac_mod=-1, dpr_mult=1.15, atk_mod=0, spd_mod=0),
+    "Skirmisher": RoleMod(hp_mult=0.95, ac_mod= 1, dpr_mult=1.00, atk_mod=1, spd_mod=10),
+    "Artillery":  RoleMod(hp_mult=0.85, ac_mod= 0, dpr_mult=1.20, atk_mod=1, spd_mod=0),
+    "Controller": RoleMod(hp_mult=1.00, ac_mod= 0, dpr_mult=0.95, atk_mod=0, spd_mod=0),
+    "Support":    RoleMod(hp_mult=0.95, ac_mod= 0, dpr_mult=0.90, atk_mod=0, spd_mod=0),
+    "Solo":       RoleMod(hp_mult=1.40, ac_mod= 1, dpr_mult=1.25, atk_mod=1, spd_mod=0),
 }
 
+# Integer role ids (position in ROLES) and the matching RoleMod rows, for batch callers
+# that carry roles as ints instead of hashing role names per monster.
+ROLE_IDS = {name: i for i, name in enumerate(ROLES)}
+ROLE_MOD_ROWS = tuple(ROLE_MODS[name] for name in ROLES)
+
 # A small, SRD-safe set of “generic” traits to spice output while staying system-compatible.
 # (No copyrighted monster text; these are original, generic building blocks.)
 TRAIT_LIBRARY = [
@@ -2,29 +2,25 @@
 
 from __future__ import annotations
 
+import re
 from typing import Optional, Dict, Any
 
-# ---- Qt binding compatibility layer (PySide6 preferred) ----
-try:
-    from PySide6.QtWidgets import (
-        QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox,
-        QLineEdit, QTextEdit, QGroupBox, QFormLayout, QCheckBox, QSpinBox
-    )
-    from PySide6.QtCore import Qt
-except ModuleNotFoundError:
-    # Fallback if the host app uses PyQt5
-    from PyQt5.QtWidgets import (
-        QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox,
-        QLineEdit, QTextEdit, QGroupBox, QFormLayout, QCheckBox, QSpinBox
-    )
-    from PyQt5.QtCore import Qt
-
-from .tables import CREATURE_TYPES, SIZES, ALIGNMENTS, ROLES
-from .generator import generate_monster, monster_to_markdown, parse_cr_label, cr_label
+from campaign_forge.core.qt_compat import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox,
+    QLineEdit, QTextEdit, QGroupBox, QFormLayout, QCheckBox, QSpinBox
+)
+
+from .tables import CREATURE_TYPES, SIZES, ALIGNMENTS, ROLES, CR_CHOICES
+from .generator import (
+    generate_monster, generate_monsters_batch, monster_to_markdown_with_audit_offset,
+    parse_cr_label, cr_label,
+)
 from .exports import export_monster_session_pack
 
 
-CR_CHOICES = ["0", "1/8", "1/4", "1/2"] + [str(i) for i in range(1, 31)]
+_AUDIT_MARKER = "\n---\n### CR Audit (Generator)\n"
+# statblock title line; only rewritten when the markdown opens with it
+_HEADING_RE = re.compile(r"\A## .*")
 
 
 class MonsterGenWidget(QWidget):
@@ -48,6 +44,9 @@ class MonsterGenWidget(QWidget):
         self._last_seed_used: Optional[int] = None
         self._last_monster_md: str = ""
         self._last_monster_name: str = ""
+        # Monster behind _last_monster_md and the UI state it was rolled from (not persisted).
+        self._last_state_key: Optional[tuple] = None
+        self._last_monster_obj = None
         self._build_ui()
 
     # ---------------- UI ----------------
@@ -97,6 +96,11 @@ class MonsterGenWidget(QWidget):
         self.iter_spin.setValue(0)
         self.iter_spin.setToolTip("Added to the internal generate counter to derive deterministic RNG.")
 
+        self.encounter_spin = QSpinBox()
+        self.encounter_spin.setRange(1, 12)
+        self.encounter_spin.setValue(4)
+        self.encounter_spin.setToolTip("Number of monsters rolled by Generate Encounter.")
+
         form.addRow("Target CR", self.cr_combo)
         form.addRow("Role", self.role_combo)
         form.addRow("Creature Type", self.type_combo)
@@ -104,6 +108,7 @@ class MonsterGenWidget(QWidget):
         form.addRow("Alignment", self.alignment_combo)
         form.addRow("Name (optional)", self.name_edit)
         form.addRow("Iteration Offset", self.iter_spin)
+        form.addRow("Encounter Size", self.encounter_spin)
         form.addRow("", self.strict_math_chk)
         form.addRow("Extra Tags", self.tags_edit)
 
@@ -112,10 +117,12 @@ class MonsterGenWidget(QWidget):
         # Buttons
         btn_row = QHBoxLayout()
         self.btn_generate = QPushButton("Generate")
+        self.btn_encounter = QPushButton("Generate Encounter")
         self.btn_reskin = QPushButton("Reskin Name Only")
         self.btn_scratchpad = QPushButton("Send to Scratchpad")
         self.btn_export = QPushButton("Export Session Pack")
         btn_row.addWidget(self.btn_generate)
+        btn_row.addWidget(self.btn_encounter)
         btn_row.addWidget(self.btn_reskin)
         btn_row.addWidget(self.btn_scratchpad)
         btn_row.addWidget(self.btn_export)
@@ -129,6 +136,7 @@ class MonsterGenWidget(QWidget):
 
         # Wire events
         self.btn_generate.clicked.connect(self.on_generate)
+        self.btn_encounter.clicked.connect(self.on_generate_encounter)
         self.btn_reskin.clicked.connect(self.on_reskin)
         self.btn_scratchpad.clicked.connect(self.on_send_scratchpad)
         self.btn_export.clicked.connect(self.on_export)
@@ -148,6 +156,7 @@ class MonsterGenWidget(QWidget):
                 "show_audit": self.strict_math_chk.isChecked(),
                 "extra_tags": self.tags_edit.text(),
                 "iter_offset": self.iter_spin.value(),
+                "encounter_size": self.encounter_spin.value(),
             },
             "data": {
                 "generate_count": self._generate_count,
@@ -175,12 +184,15 @@ class MonsterGenWidget(QWidget):
         self.strict_math_chk.setChecked(bool(ui.get("show_audit", True)))
         self.tags_edit.setText(ui.get("extra_tags", ""))
         self.iter_spin.setValue(int(ui.get("iter_offset", 0)))
+        self.encounter_spin.setValue(int(ui.get("encounter_size", 4)))
 
         data = state.get("data", {})
         self._generate_count = int(data.get("generate_count", 0))
         self._last_seed_used = data.get("last_seed_used", None)
         self._last_monster_name = data.get("last_monster_name", "")
         self._last_monster_md = data.get("last_monster_md", "")
+        self._last_state_key = None
+        self._last_monster_obj = None
 
         if self._last_monster_md:
             self.out.setPlainText(self._apply_audit_visibility(self._last_monster_md))
@@ -197,23 +209,38 @@ class MonsterGenWidget(QWidget):
         rng = self.ctx.derive_rng(master, self.plugin_id, "generate", iteration)
         return rng, iteration
 
-    def _apply_audit_visibility(self, md: str) -> str:
+    def _snapshot_ui(self):
+        """
+        Read every generator knob once per action:
+        (cr_text, role, creature_type, size, alignment, name_or_None)
+        """
+        return (
+            self.cr_combo.currentText(),
+            self.role_combo.currentText(),
+            self.type_combo.currentText(),
+            self.size_combo.currentText(),
+            self.alignment_combo.currentText(),
+            self.name_edit.text().strip() or None,
+        )
+
+    def _state_key(self, snapshot) -> tuple:
+        # Same knobs + same iteration offset => generate_monster would roll the same monster.
+        return (*snapshot, int(self.iter_spin.value()))
+
+    def _apply_audit_visibility(self, md: str, audit_offset: Optional[int] = None) -> str:
+        # audit_offset comes from the renderer for fresh statblocks; restored text is searched.
         if self.strict_math_chk.isChecked():
             return md
-        marker = "\n---\n### CR Audit (Generator)\n"
-        idx = md.find(marker)
+        idx = md.find(_AUDIT_MARKER) if audit_offset is None else audit_offset
         if idx >= 0:
             return md[:idx].rstrip() + "\n"
         return md
 
     def on_generate(self):
         try:
-            target_cr = parse_cr_label(self.cr_combo.currentText())
-            role = self.role_combo.currentText()
-            ctype = self.type_combo.currentText()
-            size = self.size_combo.currentText()
-            align = self.alignment_combo.currentText()
-            name = self.name_edit.text().strip() or None
+            snapshot = self._snapshot_ui()
+            cr_text, role, ctype, size, align, name = snapshot
+            target_cr = parse_cr_label(cr_text)
 
             rng, iteration = self._derive_rng()
             mon = generate_monster(
@@ -226,30 +253,56 @@ class MonsterGenWidget(QWidget):
                 name=name,
             )
 
-            md = monster_to_markdown(mon)
-            md = self._apply_audit_visibility(md)
+            md, audit_offset = monster_to_markdown_with_audit_offset(mon)
+            md = self._apply_audit_visibility(md, audit_offset)
 
             self._generate_count += 1
             self._last_seed_used = iteration
             self._last_monster_name = mon.name
             self._last_monster_md = md
+            self._last_state_key = self._state_key(snapshot)
+            self._last_monster_obj = mon
 
             self.out.setPlainText(md)
             self.ctx.log(f"[MonsterGen] Generated {mon.name} (Target CR {cr_label(target_cr)} → Final CR {mon.cr}). Seed iteration={iteration}")
         except Exception as e:
             self.ctx.log(f"[MonsterGen] ERROR generating monster: {e}")
 
+    def on_generate_encounter(self):
+        try:
+            cr_text, role, ctype, size, align, _name = self._snapshot_ui()
+            target_cr = parse_cr_label(cr_text)
+            count = int(self.encounter_spin.value())
+
+            # One rng, one batch call: every monster in the group draws from the same stream.
+            rng, iteration = self._derive_rng()
+            group = generate_monsters_batch(rng, (target_cr,) * count, role, ctype, size, align)
+
+            md = "\n\n".join(
+                self._apply_audit_visibility(*monster_to_markdown_with_audit_offset(m)) for m in group
+            )
+            label = f"Encounter: {count}x CR {cr_text} {role}"
+
+            self._generate_count += 1
+            self._last_seed_used = iteration
+            self._last_monster_name = label
+            self._last_monster_md = md
+            self._last_state_key = None
+            self._last_monster_obj = None
+
+            self.out.setPlainText(md)
+            self.ctx.log(f"[MonsterGen] Generated {label} ({', '.join(m.name for m in group)}). Seed iteration={iteration}")
+        except Exception as e:
+            self.ctx.log(f"[MonsterGen] ERROR generating encounter: {e}")
+
     def on_reskin(self):
         try:
             if not self._last_monster_md:
                 self.ctx.log("[MonsterGen] Nothing to reskin yet — generate first.")
                 return
 
-            target_cr = parse_cr_label(self.cr_combo.currentText())
-            role = self.role_combo.currentText()
-            ctype = self.type_combo.currentText()
-            size = self.size_combo.currentText()
-            align = self.alignment_combo.currentText()
+            cr_text, role, ctype, size, align, _name = self._snapshot_ui()
+            target_cr = parse_cr_label(cr_text)
 
             rng, _iteration = self._derive_rng()
             mon = generate_monster(
@@ -262,11 +315,11 @@ class MonsterGenWidget(QWidget):
                 name=None,
             )
 
-            md_lines = self._last_monster_md.splitlines()
-            if md_lines and md_lines[0].startswith("## "):
-                md_lines[0] = f"## {mon.name}"
+            heading = f"## {mon.name}"
             self._last_monster_name = mon.name
-            self._last_monster_md = "\n".join(md_lines)
+            self._last_monster_md = _HEADING_RE.sub(lambda _m: heading, self._last_monster_md, count=1)
+            self._last_state_key = None
+            self._last_monster_obj = None
             self.out.setPlainText(self._last_monster_md)
 
             self.ctx.log(f"[MonsterGen] Reskinned name → {mon.name}")
@@ -279,14 +332,14 @@ class MonsterGenWidget(QWidget):
                 self.ctx.log("[MonsterGen] Nothing to send — generate first.")
                 return
 
-            tags = ["Monster", "MonsterGen"]
-            tags.append(f"CR:{self.cr_combo.currentText()}")
-            tags.append(f"Type:{self.type_combo.currentText()}")
-            tags.append(f"Role:{self.role_combo.currentText()}")
+            cr_text = self.cr_combo.currentText()
+            ctype = self.type_combo.currentText()
+            role = self.role_combo.currentText()
+            tags = ["Monster", "MonsterGen", f"CR:{cr_text}", f"Type:{ctype}", f"Role:{role}"]
 
-            extra = self.tags_edit.text().strip()
-            if extra:
-                tags.extend([t.strip() for t in extra.split(",") if t.strip()])
+            if extra := self.tags_edit.text().strip():
+                # strip each extra tag once and drop the empty ones
+                tags.extend(filter(None, (t.strip() for t in extra.split(","))))
 
             self.ctx.scratchpad_add(text=self._last_monster_md, tags=tags)
             self.ctx.log(f"[MonsterGen] Sent to Scratchpad: {self._last_monster_name} (tags: {', '.join(tags)})")
@@ -299,23 +352,24 @@ class MonsterGenWidget(QWidget):
                 self.ctx.log("[MonsterGen] Nothing to export — generate first.")
                 return
 
-            target_cr = parse_cr_label(self.cr_combo.currentText())
-            role = self.role_combo.currentText()
-            ctype = self.type_combo.currentText()
-            size = self.size_combo.currentText()
-            align = self.alignment_combo.currentText()
-            name = self.name_edit.text().strip() or None
-
-            rng, iteration = self._derive_rng()
-            mon = generate_monster(
-                rng=rng,
-                target_cr=target_cr,
-                role=role,
-                creature_type=ctype,
-                size=size,
-                alignment=align,
-                name=name if name else None
-            )
+            snapshot = self._snapshot_ui()
+            if self._last_monster_obj is not None and self._state_key(snapshot) == self._last_state_key:
+                # Nothing changed since Generate: export the statblock on screen.
+                mon, iteration = self._last_monster_obj, self._last_seed_used
+            else:
+                cr_text, role, ctype, size, align, name = snapshot
+                target_cr = parse_cr_label(cr_text)
+
+                rng, iteration = self._derive_rng()
+                mon = generate_monster(
+                    rng=rng,
+                    target_cr=target_cr,
+                    role=role,
+                    creature_type=ctype,
+                    size=size,
+                    alignment=align,
+                    name=name
+                )
 
             pack_dir = export_monster_session_pack(self.ctx, mon, seed_used=iteration)
             self.ctx.log(f"[MonsterGen] Exported session pack: {pack_dir}")
@@ -1,10 +1,16 @@
 from __future__ import annotations
 import random
+import re
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 VOWELS = "aeiouy"
 CONSONANTS = "bcdfghjklmnpqrstvwxz"
+_VOWEL_SET = frozenset(VOWELS)
+# Names are built from ASCII syllables, so edits happen on a bytearray with bytes patterns.
+_TRIPLE_VOWEL_RE = re.compile(f"[{VOWELS}]{{3}}".encode("ascii"))
+_CONSONANT_BYTES = CONSONANTS.encode("ascii")
 
 DEFAULT_SYLLABLES = [
     "an","ar","ba","bel","cor","dar","del","dor","el","en","far","fen","gar","hal","iv",
@@ -22,19 +28,42 @@ class NameGenConfig:
     capitalize: bool = True
     seed: int | None = None
 
+# Simple style knobs. Expand later with grammars/markov/culture packs.
+_STYLE_SYLLABLES = {
+    "Guttural": ("gr", "kr", "zg", "uk", "rag", "mog", "dur", "gar", "th", "zor", "rak", "mok"),
+    "Elven": ("ae", "ia", "li", "ri", "el", "thil", "syl", "mir", "loth", "enya", "fina", "vara"),
+    "Dwarven": ("grim", "bar", "dur", "kaz", "gor", "thar", "brun", "kund", "bald", "orn", "dun"),
+}
+# Default fantasy syllables
+_DEFAULT_POOL = tuple(DEFAULT_SYLLABLES)
+
+def _syllable_pool(style: str) -> Tuple[str, ...]:
+    return _STYLE_SYLLABLES.get(style, _DEFAULT_POOL)
+
+def _vowel_run(s: str) -> int:
+    # Length of the leading vowel run of s.
+    n = 0
+    for ch in s:
+        if ch not in _VOWEL_SET:
+            break
+        n += 1
+    return n
+
+@lru_cache(maxsize=None)
+def _pool_can_triple_vowel(pool: Tuple[str, ...]) -> bool:
+    """
+    Whether joining syllables from pool can ever produce three vowels in a row.
+    Judged from each syllable's leading/trailing vowel runs; all-vowel syllables
+    can chain, so those pools are always treated as able to.
+    """
+    if any(_TRIPLE_VOWEL_RE.search(s.encode("ascii")) or _vowel_run(s) == len(s) for s in pool):
+        return True
+    lead = max(_vowel_run(s) for s in pool)
+    trail = max(_vowel_run(s[::-1]) for s in pool)
+    return lead + trail >= 3
+
 def _pick_syllable(rng: random.Random, style: str) -> str:
-    # Simple style knobs. Expand later with grammars/markov/culture packs.
-    if style == "Guttural":
-        base = ["gr", "kr", "zg", "uk", "rag", "mog", "dur", "gar", "th", "zor", "rak", "mok"]
-        return rng.choice(base)
-    if style == "Elven":
-        base = ["ae", "ia", "li", "ri", "el", "thil", "syl", "mir", "loth", "enya", "fina", "vara"]
-        return rng.choice(base)
-    if style == "Dwarven":
-        base = ["grim", "bar", "dur", "kaz", "gor", "thar", "brun", "kund", "bald", "orn", "dun"]
-        return rng.choice(base)
-    # Default fantasy syllables
-    return rng.choice(DEFAULT_SYLLABLES)
+    return rng.choice(_syllable_pool(style))
 
 def _maybe_apostrophe(rng: random.Random) -> str:
     return "'" if rng.random() < 0.15 else ""
@@ -44,27 +73,36 @@ def generate_names(cfg: NameGenConfig, rng: random.Random | None = None) -> List
     if cfg.seed is not None:
         rng.seed(cfg.seed)
 
+    # Resolve the style's syllable pool and the rng methods once for the whole batch.
+    pool = _syllable_pool(cfg.style)
+    choice, randint = rng.choice, rng.randint
+    lo, hi = cfg.min_syllables, cfg.max_syllables
+    # Fixed syllable count (min == max) is common; don't roll it per name.
+    fixed = lo if lo == hi else None
+    # Apostrophes and consonant swaps only break vowel runs, so pools that cannot form a
+    # triple (Guttural, Dwarven) skip the cleanup scan entirely.
+    fix_vowels = _pool_can_triple_vowel(pool)
+
     out: List[str] = []
     for _ in range(max(1, cfg.count)):
-        syl_count = rng.randint(cfg.min_syllables, cfg.max_syllables)
-        parts = [_pick_syllable(rng, cfg.style) for _ in range(syl_count)]
-
-        name = "".join(parts)
+        syl_count = fixed if fixed is not None else randint(lo, hi)
+        buf = bytearray("".join([choice(pool) for _ in range(syl_count)]), "ascii")
 
-        if cfg.allow_apostrophes and len(name) >= 6:
+        if cfg.allow_apostrophes and len(buf) >= 6:
             # insert apostrophe somewhere near middle
-            i = rng.randint(2, len(name) - 3)
-            name = name[:i] + _maybe_apostrophe(rng) + name[i:]
+            i = randint(2, len(buf) - 3)
+            if _maybe_apostrophe(rng):
+                buf[i:i] = b"'"
 
         # quick cleanup: avoid triple vowels
-        while any(name[i] in VOWELS and name[i+1] in VOWELS and name[i+2] in VOWELS for i in range(len(name)-2)):
-            # tweak by swapping one char to consonant
-            j = rng.randint(0, len(name)-1)
-            name = name[:j] + rng.choice(CONSONANTS) + name[j+1:]
+        while fix_vowels and (m := _TRIPLE_VOWEL_RE.search(buf)) is not None:
+            # tweak by swapping one char of the offending run to a consonant
+            j = m.start() + randint(0, 2)
+            buf[j] = choice(_CONSONANT_BYTES)
 
         if cfg.capitalize:
-            name = name[:1].upper() + name[1:]
+            buf[:1] = buf[:1].upper()
 
-        out.append(name)
+        out.append(buf.decode("ascii"))
 
     return out
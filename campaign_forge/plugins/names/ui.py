@@ -1,9 +1,8 @@
 from __future__ import annotations
-from PySide6.QtWidgets import (
+from campaign_forge.core.qt_compat import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QSpinBox, QComboBox, QCheckBox, QTextEdit, QGroupBox, QApplication
+    QSpinBox, QComboBox, QCheckBox, QTextEdit, QGroupBox, QApplication, Qt
 )
-from PySide6.QtCore import Qt
 
 from .generator import NameGenConfig, generate_names
 
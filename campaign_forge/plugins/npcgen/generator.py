@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import random
+from bisect import bisect_right
 from dataclasses import dataclass
+from itertools import islice
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 
@@ -15,24 +17,46 @@ ABILITIES = ("STR", "DEX", "CON", "INT", "WIS", "CHA")
 def _mod(score: int) -> int:
     return (int(score) - 10) // 2
 
+# "+n"/"-n" strings for every modifier, save and to-hit bonus an NPC can plausibly show
+_SIGNED_MIN = -10
+_SIGNED = tuple(f"{n:+d}" for n in range(_SIGNED_MIN, 31))
+
+def _signed(n: int) -> str:
+    i = n - _SIGNED_MIN
+    return _SIGNED[i] if 0 <= i < len(_SIGNED) else f"{n:+d}"
+
+def _d6(getrandbits) -> int:
+    # Same draws as rng.randint(1, 6) (3-bit rejection sampling), minus the
+    # randint -> randrange -> _randbelow call chain.
+    r = getrandbits(3)
+    while r >= 6:
+        r = getrandbits(3)
+    return r + 1
+
+def _randint(getrandbits, lo: int, hi: int) -> int:
+    # rng.randint(lo, hi) with the same draws, straight off getrandbits.
+    n = hi - lo + 1
+    if n <= 0:
+        raise ValueError(f"empty range for randint ({lo}, {hi})")
+    bits = n.bit_length()
+    r = getrandbits(bits)
+    while r >= n:
+        r = getrandbits(bits)
+    return lo + r
+
 def roll_ability_scores(rng: random.Random) -> Dict[str, int]:
     """Roll 6 ability scores using 4d6 drop lowest; assign randomly."""
+    getrandbits = rng.getrandbits
     scores: List[int] = []
     for _ in range(6):
-        rolls = [rng.randint(1, 6) for __ in range(4)]
-        rolls.sort()
-        scores.append(sum(rolls[1:]))  # drop the lowest die
+        rolls = (_d6(getrandbits), _d6(getrandbits), _d6(getrandbits), _d6(getrandbits))
+        scores.append(sum(rolls) - min(rolls))  # drop the lowest die
     rng.shuffle(scores)
-    return {abil: scores[i] for i, abil in enumerate(ABILITIES)}
+    return dict(zip(ABILITIES, scores))
 
 def ability_block_md(stats: Dict[str, int]) -> str:
-    parts: List[str] = []
-    for abil in ABILITIES:
-        sc = int(stats.get(abil, 10))
-        m = _mod(sc)
-        sign = "+" if m >= 0 else ""
-        parts.append(f"{abil} {sc} ({sign}{m})")
-    return " | ".join(parts)
+    scores = [int(stats.get(abil, 10)) for abil in ABILITIES]
+    return " | ".join([f"{abil} {sc} ({_signed(_mod(sc))})" for abil, sc in zip(ABILITIES, scores)])
 
 # ---------------------------
 # 5e-ish Combat Stat Helpers
@@ -65,101 +89,190 @@ ROLE_CLASS_WEIGHTS: Dict[str, List[Tuple[str, int]]] = {
 }
 
 ARMOR_CHOICES = {
-    "none":   [("No armor", 0)],
-    "light":  [("Leather armor", 11), ("Studded leather", 12)],
-    "medium": [("Hide armor", 12), ("Chain shirt", 13), ("Scale mail", 14)],
-    "heavy":  [("Chain mail", 16), ("Splint armor", 17), ("Plate armor", 18)],
+    "none":   (("No armor", 0),),
+    "light":  (("Leather armor", 11), ("Studded leather", 12)),
+    "medium": (("Hide armor", 12), ("Chain shirt", 13), ("Scale mail", 14)),
+    "heavy":  (("Chain mail", 16), ("Splint armor", 17), ("Plate armor", 18)),
 }
 
+# melee: (name, damage, damage type); ranged: (name, damage, damage type, range)
 WEAPONS = {
-    "melee_simple": [("Club", "1d4"), ("Mace", "1d6"), ("Spear", "1d6"), ("Handaxe", "1d6")],
-    "melee_martial": [("Longsword", "1d8"), ("Battleaxe", "1d8"), ("Warhammer", "1d8"), ("Glaive", "1d10")],
-    "ranged_simple": [("Sling", "1d4"), ("Light crossbow", "1d8"), ("Shortbow", "1d6")],
-    "ranged_martial": [("Longbow", "1d8"), ("Heavy crossbow", "1d10")],
+    "melee_simple": (
+        ("Club", "1d4", "bludgeoning"), ("Mace", "1d6", "bludgeoning"),
+        ("Spear", "1d6", "bludgeoning"), ("Handaxe", "1d6", "bludgeoning"),
+    ),
+    "melee_martial": (
+        ("Longsword", "1d8", "slashing"), ("Battleaxe", "1d8", "bludgeoning"),
+        ("Warhammer", "1d8", "bludgeoning"), ("Glaive", "1d10", "slashing"),
+    ),
+    "ranged_simple": (
+        ("Sling", "1d4", "piercing", "30/120 ft."),
+        ("Light crossbow", "1d8", "piercing", "80/320 ft."),
+        ("Shortbow", "1d6", "piercing", "80/320 ft."),
+    ),
+    "ranged_martial": (
+        ("Longbow", "1d8", "piercing", "80/320 ft."),
+        ("Heavy crossbow", "1d10", "piercing", "80/320 ft."),
+    ),
 }
 
-ARCANE_CANTRIPS = ["Arcane Bolt", "Frost Shard", "Spark", "Minor Illusion", "Mage Hand"]
-DIVINE_CANTRIPS = ["Radiant Spark", "Sacred Flame", "Guidance", "Thaumaturgy"]
-PRIMAL_CANTRIPS = ["Thorn Whip", "Stone Dart", "Primal Flame", "Druidcraft"]
-
-ARCANE_SPELLS_1 = ["Shield", "Magic Missile", "Sleep", "Burning Hands", "Charm Person"]
-ARCANE_SPELLS_2 = ["Misty Step", "Hold Person", "Invisibility", "Scorching Ray"]
-ARCANE_SPELLS_3 = ["Fireball", "Counterspell", "Haste", "Fear"]
+ARCANE_CANTRIPS = ("Arcane Bolt", "Frost Shard", "Spark", "Minor Illusion", "Mage Hand")
+DIVINE_CANTRIPS = ("Radiant Spark", "Sacred Flame", "Guidance", "Thaumaturgy")
+PRIMAL_CANTRIPS = ("Thorn Whip", "Stone Dart", "Primal Flame", "Druidcraft")
+
+ARCANE_SPELLS_1 = ("Shield", "Magic Missile", "Sleep", "Burning Hands", "Charm Person")
+ARCANE_SPELLS_2 = ("Misty Step", "Hold Person", "Invisibility", "Scorching Ray")
+ARCANE_SPELLS_3 = ("Fireball", "Counterspell", "Haste", "Fear")
+
+DIVINE_SPELLS_1 = ("Bless", "Cure Wounds", "Command", "Sanctuary")
+DIVINE_SPELLS_2 = ("Lesser Restoration", "Spiritual Weapon", "Hold Person")
+DIVINE_SPELLS_3 = ("Revivify", "Spirit Guardians", "Dispel Magic")
+
+PRIMAL_SPELLS_1 = ("Entangle", "Cure Wounds", "Fog Cloud", "Hunter's Mark")
+PRIMAL_SPELLS_2 = ("Pass without Trace", "Spike Growth", "Flame Blade")
+PRIMAL_SPELLS_3 = ("Call Lightning", "Plant Growth", "Wind Wall")
+
+# Classes missing here get role-based skills
+_CLASS_SKILLS: Dict[str, Tuple[str, ...]] = {
+    "Rogue": ("Stealth", "Sleight of Hand", "Perception"),
+    "Ranger": ("Perception", "Survival", "Stealth"),
+    "Cleric": ("Insight", "Religion"),
+    "Paladin": ("Insight", "Religion"),
+    "Wizard": ("Arcana", "Investigation"),
+    "Bard": ("Performance", "Persuasion"),
+}
+_RANGED_CHANCE: Dict[str, float] = {"Ranger": 0.65, "Wizard": 0.65, "Warlock": 0.65, "Rogue": 0.55, "Bard": 0.55}
+
+def _class_combat(cls: str, tmpl: Dict[str, Any]):
+    martial = "martial" in str(tmpl.get("weapons", ""))
+    return (
+        _CLASS_SKILLS.get(cls),
+        _RANGED_CHANCE.get(cls, 0.0),
+        WEAPONS["melee_martial"] if martial else WEAPONS["melee_simple"],
+        WEAPONS["ranged_martial"] if martial else WEAPONS["ranged_simple"],
+        cls == "Rogue",
+        frozenset(tmpl.get("save_profs", ())),
+    )
 
-DIVINE_SPELLS_1 = ["Bless", "Cure Wounds", "Command", "Sanctuary"]
-DIVINE_SPELLS_2 = ["Lesser Restoration", "Spiritual Weapon", "Hold Person"]
-DIVINE_SPELLS_3 = ["Revivify", "Spirit Guardians", "Dispel Magic"]
+# Per-class combat data derived once from CLASS_TEMPLATES:
+#   (skills or None, chance of a ranged loadout, melee pool, ranged pool, finesse, save proficiencies)
+_CLASS_COMBAT = {cls: _class_combat(cls, tmpl) for cls, tmpl in CLASS_TEMPLATES.items()}
 
-PRIMAL_SPELLS_1 = ["Entangle", "Cure Wounds", "Fog Cloud", "Hunter's Mark"]
-PRIMAL_SPELLS_2 = ["Pass without Trace", "Spike Growth", "Flame Blade"]
-PRIMAL_SPELLS_3 = ["Call Lightning", "Plant Growth", "Wind Wall"]
+POCKET_ITEMS: Sequence[str] = (
+    "Dagger", "Lantern", "Rope (50 ft.)", "Pouch of coins", "Sealing wax", "Holy token",
+    "Field rations", "Lockpicks", "Map scraps", "Vial of salt", "Scribbled letters",
+)
 
-def _weighted_choice(rng: random.Random, items: List[Tuple[str, int]]) -> str:
-    total = sum(w for _, w in items)
-    if total <= 0:
-        return items[0][0]
-    roll = rng.randint(1, total)
+def _cumulative(items: List[Tuple[str, int]]) -> Tuple[Tuple[str, ...], Tuple[int, ...], int]:
+    """Split (value, weight) pairs into (values, running weight totals, total weight)."""
+    names: List[str] = []
+    cum: List[int] = []
     acc = 0
     for v, w in items:
         acc += w
-        if roll <= acc:
-            return v
-    return items[-1][0]
-
-def _power_to_level(power: str, rng: random.Random) -> int:
-    p = (power or "Standard").strip().title()
-    if p == "Common":
-        return rng.randint(1, 2)
-    if p == "Veteran":
-        return rng.randint(4, 6)
-    if p == "Elite":
-        return rng.randint(7, 9)
-    return rng.randint(2, 4)
+        names.append(v)
+        cum.append(acc)
+    return tuple(names), tuple(cum), acc
+
+# fallback for roles without a table: plausible generalist
+_GENERALIST_WEIGHTS = [("Fighter", 3), ("Rogue", 2), ("Cleric", 1), ("Ranger", 1), ("Wizard", 1)]
+_GENERALIST_CUM = _cumulative(_GENERALIST_WEIGHTS)
+_ROLE_CLASS_CUM = {role: _cumulative(w) for role, w in ROLE_CLASS_WEIGHTS.items() if w}
+
+def _weighted_choice(rng: random.Random, table: Tuple[Tuple[str, ...], Tuple[int, ...], int]) -> str:
+    names, cum, total = table
+    if total <= 0:
+        return names[0]
+    # randrange(total) is the same draw as randint(1, total) shifted down by one.
+    return names[bisect_right(cum, rng.randrange(total))]
+
+# level range per power tier (keys lowercased); unknown tiers roll as Standard
+_POWER_LEVELS: Dict[str, Tuple[int, int]] = {
+    "common": (1, 2),
+    "standard": (2, 4),
+    "veteran": (4, 6),
+    "elite": (7, 9),
+}
 
 def proficiency_bonus(level: int) -> int:
     level = max(1, int(level))
     return 2 + (level - 1) // 4
 
+# tier -> (lo, hi, proficiency bonus for each level lo..hi)
+_POWER_INFO: Dict[str, Tuple[int, int, Tuple[int, ...]]] = {
+    tier: (lo, hi, tuple(proficiency_bonus(lvl) for lvl in range(lo, hi + 1)))
+    for tier, (lo, hi) in _POWER_LEVELS.items()
+}
+
+def _roll_level_and_pb(power: str, rng: random.Random) -> Tuple[int, int]:
+    lo, hi, pbs = _POWER_INFO.get((power or "").strip().lower(), _POWER_INFO["standard"])
+    level = _randint(rng.getrandbits, lo, hi)
+    return level, pbs[level - lo]
+
 def _pick_class_for_role(rng: random.Random, role: str) -> str:
-    role = (role or "").strip()
-    weights = ROLE_CLASS_WEIGHTS.get(role)
-    if not weights:
-        # fallback: plausible generalist
-        weights = [("Fighter", 3), ("Rogue", 2), ("Cleric", 1), ("Ranger", 1), ("Wizard", 1)]
-    return _weighted_choice(rng, weights)
+    # Roles come from ROLES, so the exact key almost always hits; only strip on a miss.
+    table = _ROLE_CLASS_CUM.get(role) or _ROLE_CLASS_CUM.get((role or "").strip(), _GENERALIST_CUM)
+    return _weighted_choice(rng, table)
+
+_TRADITION_LISTS = {
+    "divine": (DIVINE_CANTRIPS, DIVINE_SPELLS_1, DIVINE_SPELLS_2, DIVINE_SPELLS_3),
+    "primal": (PRIMAL_CANTRIPS, PRIMAL_SPELLS_1, PRIMAL_SPELLS_2, PRIMAL_SPELLS_3),
+    "arcane": (ARCANE_CANTRIPS, ARCANE_SPELLS_1, ARCANE_SPELLS_2, ARCANE_SPELLS_3),
+}
 
 def _spell_lists_for(tradition: str):
-    tradition = (tradition or "").lower()
-    if tradition == "divine":
-        return DIVINE_CANTRIPS, DIVINE_SPELLS_1, DIVINE_SPELLS_2, DIVINE_SPELLS_3
-    if tradition == "primal":
-        return PRIMAL_CANTRIPS, PRIMAL_SPELLS_1, PRIMAL_SPELLS_2, PRIMAL_SPELLS_3
-    return ARCANE_CANTRIPS, ARCANE_SPELLS_1, ARCANE_SPELLS_2, ARCANE_SPELLS_3
+    return _TRADITION_LISTS.get((tradition or "").lower(), _TRADITION_LISTS["arcane"])
+
+def _sample_small(getrandbits, pool: Sequence[str], k: int) -> List[str]:
+    """rng.sample(pool, k) for pools of up to ~20 items: same draws and result, none of its setup."""
+    pool = list(pool)
+    n = len(pool)
+    out: List[str] = []
+    for i in range(k):
+        m = n - i
+        bits = m.bit_length()
+        j = getrandbits(bits)
+        while j >= m:
+            j = getrandbits(bits)
+        out.append(pool[j])
+        pool[j] = pool[m - 1]
+    return out
+
+# (spells key, how many to pick) per spell level; cantrips are level 0
+_SPELL_PICKS = (("cantrips", 2), ("1st", 3), ("2nd", 2), ("3rd", 2))
+
+def _pick_spells(rng: random.Random, lists, max_sl: int) -> Dict[str, List[str]]:
+    """Sample cantrips plus each spell level up to max_sl from a tradition's lists."""
+    getrandbits = rng.getrandbits
+    return {
+        key: _sample_small(getrandbits, pool, min(k, len(pool)))
+        for (key, k), pool in zip(_SPELL_PICKS[: max_sl + 1], lists)
+    }
 
 def generate_combat_profile(npc: Dict[str, Any], cfg: "NpcGenConfig", rng: random.Random) -> Dict[str, Any]:
     """Generate a compact, combat-ready 5e-ish stat block for an NPC.
 
     Intentionally simplified: enough for play, not full PC rules.
     """
+    choice, random_, getrandbits = rng.choice, rng.random, rng.getrandbits  # bound once per NPC
     role = str(npc.get("role") or "")
     cls = _pick_class_for_role(rng, role)
     tmpl = CLASS_TEMPLATES.get(cls, CLASS_TEMPLATES["Fighter"])
+    class_skills, ranged_chance, melee_pool, ranged_pool, finesse, save_profs = (
+        _CLASS_COMBAT.get(cls) or _class_combat(cls, tmpl)
+    )
     power = (getattr(cfg, "power", None) or "Standard")
-    level = _power_to_level(power, rng)
-    pb = proficiency_bonus(level)
+    level, pb = _roll_level_and_pb(power, rng)
 
     stats = npc.get("stats") or {}
-    str_mod = _mod(int(stats.get("STR", 10)))
-    dex_mod = _mod(int(stats.get("DEX", 10)))
-    con_mod = _mod(int(stats.get("CON", 10)))
-    int_mod = _mod(int(stats.get("INT", 10)))
-    wis_mod = _mod(int(stats.get("WIS", 10)))
-    cha_mod = _mod(int(stats.get("CHA", 10)))
+    # _mod inlined: (score - 10) // 2 for each ability, in ABILITIES order
+    ability_mods = [(int(stats.get(abil, 10)) - 10) // 2 for abil in ABILITIES]
+    str_mod, dex_mod, con_mod, int_mod, wis_mod, cha_mod = ability_mods
 
     # Armor / AC
     armor_cat = tmpl.get("armor", "none")
-    armor_name, base = rng.choice(ARMOR_CHOICES.get(armor_cat, ARMOR_CHOICES["none"]))
-    shield = bool(tmpl.get("shield")) and rng.random() < (0.65 if power in ("Veteran", "Elite") else 0.4)
+    armor_name, base = choice(ARMOR_CHOICES.get(armor_cat, ARMOR_CHOICES["none"]))
+    shield = bool(tmpl.get("shield")) and random_() < (0.65 if power in ("Veteran", "Elite") else 0.4)
     shield_bonus = 2 if shield else 0
     if armor_cat == "none":
         ac = 10 + dex_mod + shield_bonus
@@ -176,46 +289,29 @@ def generate_combat_profile(npc: Dict[str, Any], cfg: "NpcGenConfig", rng: rando
     avg = (hd // 2) + 1
     hp = max(level, (avg * level) + (con_mod * level))
     # small variability
-    hp = int(max(level, hp + rng.randint(-level, level)))
+    hp = int(max(level, hp + _randint(getrandbits, -level, level)))
 
     speed = 30
     if role.lower() in ("hunter", "scout"):
         speed = 35
 
     # Skills (lightweight)
-    skills = []
-    if cls in ("Rogue",):
-        skills = ["Stealth", "Sleight of Hand", "Perception"]
-    elif cls in ("Ranger",):
-        skills = ["Perception", "Survival", "Stealth"]
-    elif cls in ("Cleric", "Paladin"):
-        skills = ["Insight", "Religion"]
-    elif cls in ("Wizard",):
-        skills = ["Arcana", "Investigation"]
-    elif cls in ("Bard",):
-        skills = ["Performance", "Persuasion"]
+    if class_skills is not None:
+        skills = list(class_skills)
     else:
         skills = ["Athletics", "Intimidation"] if role in ("Guard", "Officer", "Mercenary") else ["Perception"]
 
     # Saving throws
-    save_profs = set(tmpl.get("save_profs", ()))
-    save_mods = {"STR": str_mod, "DEX": dex_mod, "CON": con_mod, "INT": int_mod, "WIS": wis_mod, "CHA": cha_mod}
-    saves = {}
-    for abil, m in save_mods.items():
-        saves[abil] = m + (pb if abil in save_profs else 0)
+    saves = {abil: m + (pb if abil in save_profs else 0) for abil, m in zip(ABILITIES, ability_mods)}
 
     # Attacks
     attacks = []
-    is_melee = True
-    if cls in ("Ranger", "Wizard", "Warlock") and rng.random() < 0.65:
-        is_melee = False
-    if cls in ("Rogue", "Bard") and rng.random() < 0.55:
-        is_melee = False
+    # classes without a ranged chance never roll for it
+    is_melee = not (ranged_chance and random_() < ranged_chance)
 
     if is_melee:
-        pool = WEAPONS["melee_martial"] if "martial" in str(tmpl.get("weapons", "")) else WEAPONS["melee_simple"]
-        wname, dmg = rng.choice(pool)
-        attack_mod = max(str_mod, dex_mod) if cls in ("Rogue",) else str_mod
+        wname, dmg, dtype = choice(melee_pool)
+        attack_mod = max(str_mod, dex_mod) if finesse else str_mod
         to_hit = attack_mod + pb
         attacks.append({
             "name": wname,
@@ -223,27 +319,25 @@ def generate_combat_profile(npc: Dict[str, Any], cfg: "NpcGenConfig", rng: rando
             "to_hit": to_hit,
             "reach": "5 ft.",
             "damage": f"{dmg} + {attack_mod}",
-            "damage_type": "slashing" if "sword" in wname.lower() or "glaive" in wname.lower() else "bludgeoning",
+            "damage_type": dtype,
         })
     else:
-        pool = WEAPONS["ranged_martial"] if "martial" in str(tmpl.get("weapons", "")) else WEAPONS["ranged_simple"]
-        wname, dmg = rng.choice(pool)
+        wname, dmg, dtype, wrange = choice(ranged_pool)
         attack_mod = dex_mod
         to_hit = attack_mod + pb
         attacks.append({
             "name": wname,
             "type": "Ranged Weapon Attack",
             "to_hit": to_hit,
-            "range": "80/320 ft." if "bow" in wname.lower() else "30/120 ft.",
+            "range": wrange,
             "damage": f"{dmg} + {attack_mod}",
-            "damage_type": "piercing",
+            "damage_type": dtype,
         })
 
     # Optional spellcasting
     tradition = tmpl.get("caster")
     spells: Dict[str, Any] = {}
     if tradition:
-        can, s1, s2, s3 = _spell_lists_for(tradition)
         # Determine max spell level by level
         max_sl = 1
         if level >= 5:
@@ -255,13 +349,7 @@ def generate_combat_profile(npc: Dict[str, Any], cfg: "NpcGenConfig", rng: rando
         spells["spell_attack_bonus"] = (pb + (int_mod if tradition == "arcane" else wis_mod if tradition in ("divine","primal") else cha_mod))
         key_mod = int_mod if tradition == "arcane" else wis_mod if tradition in ("divine","primal") else cha_mod
         spells["save_dc"] = 8 + pb + key_mod
-        spells["cantrips"] = rng.sample(can, k=min(2, len(can)))
-        if max_sl >= 1:
-            spells["1st"] = rng.sample(s1, k=min(3, len(s1)))
-        if max_sl >= 2:
-            spells["2nd"] = rng.sample(s2, k=min(2, len(s2)))
-        if max_sl >= 3:
-            spells["3rd"] = rng.sample(s3, k=min(2, len(s3)))
+        spells.update(_pick_spells(rng, _spell_lists_for(tradition), max_sl))
 
         # If we generated a caster, also add a simple "spell" attack option
         sp_name = "Arcane Bolt" if tradition == "arcane" else "Radiant Spark" if tradition == "divine" else "Thorn Whip"
@@ -284,10 +372,7 @@ def generate_combat_profile(npc: Dict[str, Any], cfg: "NpcGenConfig", rng: rando
     if len(attacks) > 1:
         equipment.append(attacks[1]["name"])
     # Add a couple flavorful items
-    equipment.extend(rng.sample([
-        "Dagger", "Lantern", "Rope (50 ft.)", "Pouch of coins", "Sealing wax", "Holy token",
-        "Field rations", "Lockpicks", "Map scraps", "Vial of salt", "Scribbled letters"
-    ], k=2))
+    equipment.extend(_sample_small(rng.getrandbits, POCKET_ITEMS, 2))
 
     # Simple traits
     traits = []
@@ -314,6 +399,17 @@ def generate_combat_profile(npc: Dict[str, Any], cfg: "NpcGenConfig", rng: rando
         "traits": traits,
     }
 
+def _attack_line_md(a: Dict[str, Any]) -> str:
+    # Attacks round-trip through project JSON (and hand edits), so they stay plain
+    # dicts with optional keys; bind .get once rather than per field.
+    get = a.get
+    rr = get("reach") or get("range") or ""
+    tail = f" ({rr})" if rr else ""
+    return (
+        f"- *{get('name', 'Attack')}* — {get('type', '')}: {_signed(int(get('to_hit', 0)))} to hit{tail}; "
+        f"Hit: {get('damage', '')} {get('damage_type', '')}"
+    ).rstrip()
+
 def combat_block_md(combat: Dict[str, Any], stats: Dict[str, int]) -> str:
     if not combat:
         return ""
@@ -328,13 +424,7 @@ def combat_block_md(combat: Dict[str, Any], stats: Dict[str, int]) -> str:
     lines.append(f"**Combat:** {cls} (Lvl {level})  |  **AC** {ac}  |  **HP** {hp}  |  **Speed** {speed} ft.  |  **PB** +{pb}")
     saves = combat.get("saves") or {}
     if saves:
-        save_bits = []
-        for abil in ABILITIES:
-            v = saves.get(abil)
-            if v is None:
-                continue
-            sign = "+" if int(v) >= 0 else ""
-            save_bits.append(f"{abil} {sign}{int(v)}")
+        save_bits = [f"{abil} {_signed(int(saves[abil]))}" for abil in ABILITIES if saves.get(abil) is not None]
         if save_bits:
             lines.append("**Saves:** " + ", ".join(save_bits))
     skills = combat.get("skills") or []
@@ -349,18 +439,7 @@ def combat_block_md(combat: Dict[str, Any], stats: Dict[str, int]) -> str:
     if attacks:
         lines.append("")
         lines.append("**Attacks:**")
-        for a in attacks:
-            nm = a.get("name","Attack")
-            typ = a.get("type","")
-            to_hit = int(a.get("to_hit",0))
-            sign = "+" if to_hit >= 0 else ""
-            reach = a.get("reach") or ""
-            rng = a.get("range") or ""
-            rr = reach if reach else rng
-            dmg = a.get("damage","")
-            dt = a.get("damage_type","")
-            tail = f" ({rr})" if rr else ""
-            lines.append(f"- *{nm}* — {typ}: {sign}{to_hit} to hit{tail}; Hit: {dmg} {dt}".rstrip())
+        lines.extend([_attack_line_md(a) for a in attacks])
 
     spells = combat.get("spells") or {}
     if spells:
@@ -509,6 +588,11 @@ SECRETS: Sequence[str] = (
     "saw a noble commit a crime and is terrified",
 )
 
+EPITHETS: Sequence[str] = ("of the Bridge", "the Quiet", "Red-Hand", "Two-Coins", "Blackthread", "Pale-Eye")
+
+# Stand-ins for {faction} when the roster has none.
+SECRET_FACTIONS: Sequence[str] = ("the City Watch", "the Candle Cult", "House Vellum", "the Smugglers' Ring")
+
 RUMORS: Sequence[str] = (
     "says the old well is deeper than the map claims",
     "heard chanting beneath the cobbles after midnight",
@@ -538,6 +622,13 @@ REL_TYPES: Sequence[Tuple[str, str]] = (
     ("hates", "would gladly ruin"),
 )
 
+# One-way relations get a random direction so they read as personal
+ASYMMETRIC_RELS = frozenset({"owes", "blackmail", "handler", "informant", "protects"})
+# REL_TYPES with the direction flag attached; same length and order, so draws line up
+_REL_CHOICES: Sequence[Tuple[str, str, bool]] = tuple((k, t, k in ASYMMETRIC_RELS) for k, t in REL_TYPES)
+_REL_COUNT = len(_REL_CHOICES)
+_REL_BITS = _REL_COUNT.bit_length()
+
 
 # ---------------------------
 # Generation helpers
@@ -553,12 +644,12 @@ def list_roles() -> List[str]:
 
 def _pick_name(rng: random.Random, culture: str) -> str:
     pack = CULTURE_PACKS.get(culture) or CULTURE_PACKS["Common"]
-    first = rng.choice(list(pack["first"]))
-    last = rng.choice(list(pack["last"]))
+    first = rng.choice(pack["first"])
+    last = rng.choice(pack["last"])
 
     # Small chance of epithet / street-name
     if rng.random() < 0.12:
-        epithet = rng.choice(["of the Bridge", "the Quiet", "Red-Hand", "Two-Coins", "Blackthread", "Pale-Eye"])
+        epithet = rng.choice(EPITHETS)
         return f"{first} {last} {epithet}"
 
     return f"{first} {last}"
@@ -566,26 +657,25 @@ def _pick_name(rng: random.Random, culture: str) -> str:
 
 def _pick_appearance_tags(rng: random.Random, culture: str, k_min: int = 2, k_max: int = 4) -> List[str]:
     pack = CULTURE_PACKS.get(culture) or CULTURE_PACKS["Common"]
-    pool = list(pack.get("appearance", ()))
-    k = rng.randint(k_min, k_max)
-    rng.shuffle(pool)
-    return pool[: min(k, len(pool))]
+    pool = pack.get("appearance", ())
+    k = _randint(rng.getrandbits, k_min, k_max)
+    return rng.sample(pool, k=min(k, len(pool)))
 
 
 def _pick_role(rng: random.Random, role: str) -> str:
     if role and role != "Any":
         return role
-    return rng.choice(list(ROLES))
+    return rng.choice(ROLES)
 
 
 def _format_secret(rng: random.Random, faction: str) -> str:
-    tmpl = rng.choice(list(SECRETS))
-    f = faction.strip() or rng.choice(["the City Watch", "the Candle Cult", "House Vellum", "the Smugglers' Ring"])
+    tmpl = rng.choice(SECRETS)
+    f = faction.strip() or rng.choice(SECRET_FACTIONS)
     return tmpl.format(faction=f)
 
 
 def _format_rumor(rng: random.Random) -> str:
-    return rng.choice(list(RUMORS))
+    return rng.choice(RUMORS)
 
 
 def generate_roster(cfg: NpcGenConfig, rng: random.Random) -> Dict[str, object]:
@@ -598,29 +688,36 @@ def generate_roster(cfg: NpcGenConfig, rng: random.Random) -> Dict[str, object]:
     culture = cfg.culture or "Common"
     faction = (cfg.faction or "").strip()
 
+    choice, getrandbits = rng.choice, rng.getrandbits
     npcs: List[Dict[str, object]] = []
     for i in range(count):
         name = _pick_name(rng, culture)
         role = _pick_role(rng, cfg.role)
-        tics = list(ROLE_TICS.get(role, ()))
-        tic = rng.choice(tics) if tics else ""
-
-        npc = {
+        tics = ROLE_TICS.get(role, ())
+        tic = choice(tics) if tics else ""
+
+        # Draw order matches the field order below; combat comes last so the
+        # NPC dict can be built once, complete.
+        appearance = _pick_appearance_tags(rng, culture)
+        secret = _format_secret(rng, faction)
+        rumors = [ _format_rumor(rng) for _ in range(_randint(getrandbits, 1, 2)) ]
+        stats = roll_ability_scores(rng)
+        combat = generate_combat_profile({"role": role, "stats": stats}, cfg, rng)
+
+        npcs.append({
             "id": f"npc{i+1}",
             "name": name,
             "culture": culture,
             "role": role,
             "faction": faction,
-            "appearance": _pick_appearance_tags(rng, culture),
+            "appearance": appearance,
             "tic": tic,
-            "secret": _format_secret(rng, faction),
-            "rumors": [ _format_rumor(rng) for _ in range(rng.randint(1, 2)) ],
-            "stats": roll_ability_scores(rng),
-            "combat": {},
+            "secret": secret,
+            "rumors": rumors,
+            "stats": stats,
+            "combat": combat,
             "notes": "",
-        }
-        npc["combat"] = generate_combat_profile(npc, cfg, rng)
-        npcs.append(npc)
+        })
 
     rels = generate_relationships(
         npc_ids=[n["id"] for n in npcs],
@@ -666,26 +763,25 @@ def generate_relationships(
     if max_per_npc > 0:
         target_edges = min(target_edges, (n * max_per_npc) // 2)
 
-    # Build candidate pairs
-    pairs: List[Tuple[str, str]] = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            pairs.append((ids[i], ids[j]))
-    rng.shuffle(pairs)
+    if target_edges <= 0:
+        return []
 
     degree: Dict[str, int] = {i: 0 for i in ids}
     edges: List[Dict[str, str]] = []
+    getrandbits, random_ = rng.getrandbits, rng.random
 
-    for a, b in pairs:
-        if len(edges) >= target_edges:
-            break
+    def _link(a: str, b: str) -> None:
         if max_per_npc > 0 and (degree[a] >= max_per_npc or degree[b] >= max_per_npc):
-            continue
+            return
 
-        rel_key, rel_text = rng.choice(list(REL_TYPES))
+        # rng.choice(_REL_CHOICES), unrolled: same rejection draws, no per-edge call chain
+        r = getrandbits(_REL_BITS)
+        while r >= _REL_COUNT:
+            r = getrandbits(_REL_BITS)
+        rel_key, rel_text, one_way = _REL_CHOICES[r]
 
         # Randomly orient some relations to feel more personal
-        if rel_key in {"owes", "blackmail", "handler", "informant", "protects"} and rng.random() < 0.5:
+        if one_way and random_() < 0.5:
             a, b = b, a
 
         edges.append({
@@ -697,6 +793,50 @@ def generate_relationships(
         degree[a] += 1
         degree[b] += 1
 
+    seen: set = set()
+    open_nodes = list(range(n))
+    if 4 * target_edges < complete:
+        # Sparse web: draw random pairs instead of enumerating all n*(n-1)/2 of them.
+        # NPCs leave the draw once they hit the degree cap, so only repeat pairs miss;
+        # once those pile up the sweep below takes over.
+        randrange = rng.randrange
+        misses = 0
+        while len(edges) < target_edges and misses <= target_edges:
+            m = len(open_nodes)
+            if m < 2:
+                return edges
+            # two distinct open NPCs
+            x, y = randrange(m), randrange(m - 1)
+            if y >= x:
+                y += 1
+            i, j = open_nodes[x], open_nodes[y]
+            key = (i, j) if i < j else (j, i)
+            if key in seen:
+                misses += 1
+                continue
+            seen.add(key)
+            _link(ids[key[0]], ids[key[1]])
+            if max_per_npc > 0:
+                for k in key:
+                    if degree[ids[k]] >= max_per_npc:
+                        open_nodes.remove(k)
+        if len(edges) >= target_edges:
+            return edges
+
+    # Sweep the remaining candidate pairs between NPCs still under the cap
+    pairs: List[Tuple[str, str]] = [
+        (ids[i], ids[j])
+        for x, i in enumerate(open_nodes)
+        for j in open_nodes[x + 1:]
+        if not seen or (i, j) not in seen
+    ]
+    rng.shuffle(pairs)
+
+    for a, b in pairs:
+        if len(edges) >= target_edges:
+            break
+        _link(a, b)
+
     return edges
 
 # ---------------------------
@@ -710,11 +850,15 @@ def npc_to_markdown(
     *,
     roster: Optional[Dict[str, Any]] = None,
     faction: str = "",
-    include_header: bool = True
+    include_header: bool = True,
+    by_id: Optional[Dict[str, Dict[str, Any]]] = None,
+    my_rels: Optional[Sequence[Dict[str, str]]] = None,
 ) -> str:
     """Render a single NPC to a session-useful Markdown blurb.
 
     Accepts optional roster (with relationships) to include a per-NPC relationship section.
+    Callers rendering many NPCs can pass a prebuilt id -> npc map (by_id) and this NPC's
+    edges (my_rels) instead of having each call scan the roster.
     """
     name = npc.get("name", "Unknown")
     role = npc.get("role", "")
@@ -783,21 +927,25 @@ def npc_to_markdown(
             lines.append(f"- {s}")
 
     # Per-NPC relationships (if roster provided)
-    if roster and roster.get("relationships"):
-        rels = roster.get("relationships") or []
-        npcs = roster.get("npcs") or []
-        by_id = {n.get("id"): n for n in npcs if n.get("id")}
-        my_id = npc.get("id")
-        my_rels = [e for e in rels if e.get("a") == my_id or e.get("b") == my_id]
-        if my_rels:
-            lines.append("")
-            lines.append("**Relationships:**")
-            for e in my_rels[:6]:
-                other_id = e.get("b") if e.get("a") == my_id else e.get("a")
-                other = by_id.get(other_id, {})
-                other_name = other.get("name", "?")
-                text = e.get("text", e.get("type", ""))
-                lines.append(f"- {other_name} — {text}")
+    my_id = npc.get("id")
+    if my_rels is None and roster and roster.get("relationships"):
+        # Only the first 6 are shown, so stop scanning the edge list once we have them
+        my_rels = list(islice((e for e in roster["relationships"] if e.get("a") == my_id or e.get("b") == my_id), 6))
+    if my_rels:
+        my_rels = my_rels[:6]
+        if by_id is None:
+            # Index just the NPCs these edges point at, not the whole roster
+            wanted = {e.get("b") if e.get("a") == my_id else e.get("a") for e in my_rels}
+            npcs = (roster or {}).get("npcs") or []
+            by_id = {n.get("id"): n for n in npcs if n.get("id") and n.get("id") in wanted}
+        lines.append("")
+        lines.append("**Relationships:**")
+        for e in my_rels:
+            other_id = e.get("b") if e.get("a") == my_id else e.get("a")
+            other = by_id.get(other_id, {})
+            other_name = other.get("name", "?")
+            text = e.get("text", e.get("type", ""))
+            lines.append(f"- {other_name} — {text}")
 
     notes = (npc.get("notes") or "").strip()
     if notes:
@@ -856,4 +1004,10 @@ def npc_roster_to_markdown(roster: Dict[str, Any], *, title: str = "NPC Roster")
             text = e.get("text", e.get("type", ""))
             lines.append(f"- **{a_name}** ↔ **{b_name}** — {text}")
 
-    return "\n".join(lines).rstrip() + "\n"
+    # Trim the tail on the list so the document is only joined once (no rstrip copy).
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if lines:
+        lines[-1] = lines[-1].rstrip()
+    lines.append("")
+    return "\n".join(lines)